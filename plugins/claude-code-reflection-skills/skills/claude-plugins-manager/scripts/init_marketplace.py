@@ -10,8 +10,11 @@ import argparse
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+from plugin_common import format_tree
+
 
 def create_marketplace_json(name: str, owner_name: str = "Your Name") -> dict:
     """Create the marketplace.json manifest."""
@@ -28,9 +31,7 @@ def create_marketplace_json(name: str, owner_name: str = "Your Name") -> dict:
     }
 
 
-def create_marketplace_readme(name: str) -> str:
-    """Create README.md content for marketplace."""
-    return f"""# {name.replace('-', ' ').title()} Marketplace
+README_TEMPLATE = """# {title} Marketplace
 
 A Claude Code plugin marketplace.
 
@@ -72,6 +73,17 @@ MIT License
 """
 
 
+@lru_cache(maxsize=None)
+def _title(name: str) -> str:
+    """Turn a kebab-case name into a Title Case heading."""
+    return name.replace('-', ' ').title()
+
+
+def create_marketplace_readme(name: str) -> str:
+    """Create README.md content for marketplace."""
+    return README_TEMPLATE.format(name=name, title=_title(name))
+
+
 def add_plugin_to_marketplace(marketplace_json: dict, plugin_name: str, plugin_path: str) -> dict:
     """Add a plugin entry to marketplace.json."""
     plugin_entry = {
@@ -84,23 +96,23 @@ def add_plugin_to_marketplace(marketplace_json: dict, plugin_name: str, plugin_p
     return marketplace_json
 
 
-def init_marketplace(
+def plan_marketplace(
     name: str,
     output_path: str,
     owner_name: str = "Your Name",
     initial_plugins: list = None
-) -> Path:
-    """Initialize a new marketplace directory structure."""
+) -> tuple[Path, list[Path], list[tuple[Path, str]]]:
+    """Plan a marketplace's directories and files without touching the disk.
 
+    Returns:
+        Tuple of (marketplace_dir, leaf_dirs, writes), where writes holds
+        (path, content) for every file init_marketplace creates
+    """
     marketplace_dir = Path(output_path) / name
-    if marketplace_dir.exists():
-        raise FileExistsError(f"Directory already exists: {marketplace_dir}")
-
-    marketplace_dir.mkdir(parents=True)
-
-    # Create .claude-plugin directory
     claude_plugin_dir = marketplace_dir / ".claude-plugin"
-    claude_plugin_dir.mkdir()
+    plugins_dir = marketplace_dir / "plugins"
+    dirs = [claude_plugin_dir]
+    writes: list[tuple[Path, str]] = []
 
     # Create marketplace.json
     marketplace_json = create_marketplace_json(name, owner_name)
@@ -112,39 +124,51 @@ def init_marketplace(
             marketplace_json = add_plugin_to_marketplace(
                 marketplace_json, plugin_name, plugin_path
             )
-            # Create plugin directory
-            plugin_dir = marketplace_dir / "plugins" / plugin_name
-            plugin_dir.mkdir(parents=True)
-            # Create minimal plugin structure
-            (plugin_dir / ".claude-plugin").mkdir()
-            with open(plugin_dir / ".claude-plugin" / "plugin.json", "w") as f:
-                json.dump({
-                    "name": plugin_name,
-                    "description": f"TODO: Add description for {plugin_name}",
-                    "version": "1.0.0",
-                    "author": {"name": owner_name}
-                }, f, indent=2)
-            with open(plugin_dir / "README.md", "w") as f:
-                f.write(f"# {plugin_name}\n\nTODO: Add documentation\n")
-
-    with open(claude_plugin_dir / "marketplace.json", "w") as f:
-        json.dump(marketplace_json, f, indent=2)
-
-    # Create plugins directory
-    plugins_dir = marketplace_dir / "plugins"
-    if not plugins_dir.exists():
-        plugins_dir.mkdir()
-        with open(plugins_dir / ".gitkeep", "w") as f:
-            f.write("")
+            # Minimal plugin structure
+            plugin_dir = plugins_dir / plugin_name
+            dirs.append(plugin_dir / ".claude-plugin")
+            writes.append((plugin_dir / ".claude-plugin" / "plugin.json", json.dumps({
+                "name": plugin_name,
+                "description": f"TODO: Add description for {plugin_name}",
+                "version": "1.0.0",
+                "author": {"name": owner_name}
+            }, indent=2)))
+            writes.append((plugin_dir / "README.md", f"# {plugin_name}\n\nTODO: Add documentation\n"))
+    else:
+        dirs.append(plugins_dir)
+        writes.append((plugins_dir / ".gitkeep", ""))
+
+    writes.append((claude_plugin_dir / "marketplace.json", json.dumps(marketplace_json, indent=2)))
+    writes.append((marketplace_dir / "README.md", create_marketplace_readme(name)))
+    writes.append((marketplace_dir / "LICENSE", "MIT License\n\nCopyright (c) 2024\n\nTODO: Add full license text"))
+
+    return marketplace_dir, dirs, writes
+
+
+def create_planned(marketplace_dir: Path, dirs: list[Path], writes: list[tuple[Path, str]]) -> None:
+    """Create a marketplace planned by plan_marketplace."""
+    if marketplace_dir.exists():
+        raise FileExistsError(f"Directory already exists: {marketplace_dir}")
+
+    # Every planned directory is a leaf; makedirs creates marketplace_dir and
+    # any intermediate directories on the way down. A repeated plugin name
+    # still fails here with FileExistsError
+    for d in dirs:
+        os.makedirs(d)
 
-    # Create README.md
-    with open(marketplace_dir / "README.md", "w") as f:
-        f.write(create_marketplace_readme(name))
+    for path, content in writes:
+        path.write_text(content)
 
-    # Create LICENSE
-    with open(marketplace_dir / "LICENSE", "w") as f:
-        f.write("MIT License\n\nCopyright (c) 2024\n\nTODO: Add full license text")
 
+def init_marketplace(
+    name: str,
+    output_path: str,
+    owner_name: str = "Your Name",
+    initial_plugins: list = None
+) -> Path:
+    """Initialize a new marketplace directory structure."""
+    marketplace_dir, dirs, writes = plan_marketplace(name, output_path, owner_name, initial_plugins)
+    create_planned(marketplace_dir, dirs, writes)
     return marketplace_dir
 
 
@@ -176,22 +200,18 @@ def main():
     args = parser.parse_args()
 
     try:
-        marketplace_dir = init_marketplace(
+        # Plan once so the created tree can be printed without a re-walk
+        marketplace_dir, dirs, writes = plan_marketplace(
             name=args.marketplace_name,
             output_path=args.path,
             owner_name=args.owner,
             initial_plugins=args.plugins
         )
+        create_planned(marketplace_dir, dirs, writes)
 
         print(f"✅ Marketplace '{args.marketplace_name}' initialized at: {marketplace_dir}")
         print("\nCreated structure:")
-        for root, dirs, files in os.walk(marketplace_dir):
-            level = root.replace(str(marketplace_dir), '').count(os.sep)
-            indent = '  ' * level
-            print(f"{indent}{os.path.basename(root)}/")
-            subindent = '  ' * (level + 1)
-            for file in files:
-                print(f"{subindent}{file}")
+        print(format_tree(marketplace_dir, [path for path, _ in writes]))
 
         print("\nNext steps:")
         print("1. Edit .claude-plugin/marketplace.json with your details")
@@ -10,8 +10,41 @@ import argparse
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from plugin_common import format_tree
+
+
+# The hooks and MCP templates never vary, so serialize them once at import
+HOOKS_JSON = json.dumps({
+    "hooks": {
+        "PostToolUse": [
+            {
+                "matcher": "Write|Edit",
+                "hooks": [
+                    {
+                        "type": "command",
+                        "command": "${CLAUDE_PLUGIN_ROOT}/scripts/validate.sh",
+                        "description": "TODO: Replace with actual hook"
+                    }
+                ]
+            }
+        ]
+    }
+}, indent=2)
+
+MCP_JSON = json.dumps({
+    "mcpServers": {
+        "example-server": {
+            "command": "node",
+            "args": ["./servers/server.js"],
+            "env": {}
+        }
+    }
+}, indent=2)
+
 
 def create_plugin_json(plugin_name: str, author_name: str = "Your Name") -> dict:
     """Create the plugin.json manifest."""
@@ -26,9 +59,7 @@ def create_plugin_json(plugin_name: str, author_name: str = "Your Name") -> dict
     }
 
 
-def create_readme(plugin_name: str) -> str:
-    """Create README.md content."""
-    return f"""# {plugin_name.replace('-', ' ').title()}
+README_TEMPLATE = """# {title}
 
 ## Description
 
@@ -45,7 +76,7 @@ TODO: Describe what this plugin does.
 ### Install the Plugin
 
 ```bash
-/plugin install {plugin_name}@<marketplace>
+/plugin install {name}@<marketplace>
 ```
 
 ## Usage
@@ -63,25 +94,21 @@ MIT License
 """
 
 
-def create_command_template(command_name: str) -> str:
-    """Create a command markdown file."""
-    return f"""---
-description: TODO: Describe what /{command_name} does
+COMMAND_TEMPLATE = """---
+description: TODO: Describe what /{name} does
 ---
 
-# {command_name.replace('-', ' ').title()} Command
+# {title} Command
 
 TODO: Add instructions for Claude when this command is invoked.
 """
 
 
-def create_agent_template(agent_name: str) -> str:
-    """Create an agent markdown file."""
-    return f"""---
+AGENT_TEMPLATE = """---
 description: TODO: Describe this agent's specialty
 ---
 
-# {agent_name.replace('-', ' ').title()} Agent
+# {title} Agent
 
 TODO: Add detailed instructions and expertise for this agent.
 
@@ -96,14 +123,12 @@ Use this agent when...
 """
 
 
-def create_skill_template(skill_name: str) -> str:
-    """Create a SKILL.md file."""
-    return f"""---
-name: {skill_name}
+SKILL_TEMPLATE = """---
+name: {name}
 description: TODO: What this skill does. Use when ...
 ---
 
-# {skill_name.replace('-', ' ').title()}
+# {title}
 
 ## Capability
 
@@ -115,37 +140,30 @@ TODO: How to use this skill.
 """
 
 
-def create_hooks_json() -> dict:
-    """Create hooks.json template."""
-    return {
-        "hooks": {
-            "PostToolUse": [
-                {
-                    "matcher": "Write|Edit",
-                    "hooks": [
-                        {
-                            "type": "command",
-                            "command": "${CLAUDE_PLUGIN_ROOT}/scripts/validate.sh",
-                            "description": "TODO: Replace with actual hook"
-                        }
-                    ]
-                }
-            ]
-        }
-    }
+@lru_cache(maxsize=None)
+def _title(name: str) -> str:
+    """Turn a kebab-case name into a Title Case heading."""
+    return name.replace('-', ' ').title()
 
 
-def create_mcp_json() -> dict:
-    """Create .mcp.json template."""
-    return {
-        "mcpServers": {
-            "example-server": {
-                "command": "node",
-                "args": ["./servers/server.js"],
-                "env": {}
-            }
-        }
-    }
+def create_readme(plugin_name: str) -> str:
+    """Create README.md content."""
+    return README_TEMPLATE.format(name=plugin_name, title=_title(plugin_name))
+
+
+def create_command_template(command_name: str) -> str:
+    """Create a command markdown file."""
+    return COMMAND_TEMPLATE.format(name=command_name, title=_title(command_name))
+
+
+def create_agent_template(agent_name: str) -> str:
+    """Create an agent markdown file."""
+    return AGENT_TEMPLATE.format(title=_title(agent_name))
+
+
+def create_skill_template(skill_name: str) -> str:
+    """Create a SKILL.md file."""
+    return SKILL_TEMPLATE.format(name=skill_name, title=_title(skill_name))
 
 
 def init_plugin(
@@ -169,60 +187,70 @@ def init_plugin(
     if plugin_dir.exists():
         raise FileExistsError(f"Directory already exists: {plugin_dir}")
 
-    plugin_dir.mkdir(parents=True)
-
-    # Create .claude-plugin directory and plugin.json
+    # Plan every file up front, then create directories and write in a batch
     claude_plugin_dir = plugin_dir / ".claude-plugin"
-    claude_plugin_dir.mkdir()
-
-    plugin_json = create_plugin_json(plugin_name, author_name)
-    with open(claude_plugin_dir / "plugin.json", "w") as f:
-        json.dump(plugin_json, f, indent=2)
-
-    # Create README.md
-    with open(plugin_dir / "README.md", "w") as f:
-        f.write(create_readme(plugin_name))
-
-    # Create LICENSE
-    with open(plugin_dir / "LICENSE", "w") as f:
-        f.write("MIT License\n\nCopyright (c) 2024\n\nTODO: Add full license text")
-
-    # Create optional components
+    dirs = [claude_plugin_dir]
+    writes: list[tuple[Path, str]] = [
+        (claude_plugin_dir / "plugin.json",
+         json.dumps(create_plugin_json(plugin_name, author_name), indent=2)),
+        (plugin_dir / "README.md", create_readme(plugin_name)),
+        (plugin_dir / "LICENSE",
+         "MIT License\n\nCopyright (c) 2024\n\nTODO: Add full license text"),
+    ]
+
+    # Optional components
     if with_commands:
         commands_dir = plugin_dir / "commands"
-        commands_dir.mkdir()
-        with open(commands_dir / "example.md", "w") as f:
-            f.write(create_command_template("example"))
+        dirs.append(commands_dir)
+        writes.append((commands_dir / "example.md", create_command_template("example")))
 
     if with_agents:
         agents_dir = plugin_dir / "agents"
-        agents_dir.mkdir()
-        with open(agents_dir / "example-agent.md", "w") as f:
-            f.write(create_agent_template("example-agent"))
+        dirs.append(agents_dir)
+        writes.append((agents_dir / "example-agent.md", create_agent_template("example-agent")))
 
     if with_skills:
         skills_dir = plugin_dir / "skills" / "example-skill"
-        skills_dir.mkdir(parents=True)
-        with open(skills_dir / "SKILL.md", "w") as f:
-            f.write(create_skill_template("example-skill"))
+        dirs.append(skills_dir)
+        writes.append((skills_dir / "SKILL.md", create_skill_template("example-skill")))
 
     if with_hooks:
         hooks_dir = plugin_dir / "hooks"
-        hooks_dir.mkdir()
-        with open(hooks_dir / "hooks.json", "w") as f:
-            json.dump(create_hooks_json(), f, indent=2)
+        dirs.append(hooks_dir)
+        writes.append((hooks_dir / "hooks.json", HOOKS_JSON))
 
     if with_mcp:
-        with open(plugin_dir / ".mcp.json", "w") as f:
-            json.dump(create_mcp_json(), f, indent=2)
         servers_dir = plugin_dir / "servers"
-        servers_dir.mkdir()
-        with open(servers_dir / ".gitkeep", "w") as f:
-            f.write("")
+        dirs.append(servers_dir)
+        writes.append((plugin_dir / ".mcp.json", MCP_JSON))
+        writes.append((servers_dir / ".gitkeep", ""))
+
+    # Every planned directory is a leaf; makedirs creates plugin_dir and any
+    # intermediate directories (e.g. skills/) on the way down
+    for d in dirs:
+        os.makedirs(d, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # list() drains the iterator so write errors propagate here
+        list(executor.map(lambda item: item[0].write_text(item[1]), writes))
 
     return plugin_dir
 
 
+def print_tree(root: Path) -> None:
+    """Print the files below root as a tree (see format_tree)."""
+    files = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(Path(entry.path))
+    print(format_tree(root, files))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Initialize a new Claude Code plugin"
@@ -297,13 +325,7 @@ def main():
 
         print(f"✅ Plugin '{args.plugin_name}' initialized at: {plugin_dir}")
         print("\nCreated structure:")
-        for root, dirs, files in os.walk(plugin_dir):
-            level = root.replace(str(plugin_dir), '').count(os.sep)
-            indent = '  ' * level
-            print(f"{indent}{os.path.basename(root)}/")
-            subindent = '  ' * (level + 1)
-            for file in files:
-                print(f"{subindent}{file}")
+        print_tree(plugin_dir)
 
         print("\nNext steps:")
         print("1. Edit .claude-plugin/plugin.json with your plugin details")
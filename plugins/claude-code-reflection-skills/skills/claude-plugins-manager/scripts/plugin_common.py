@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Shared helpers for the Claude Code plugin and marketplace scripts."""
+
+from pathlib import Path
+
+
+def format_tree(root: Path, files: list[Path]) -> str:
+    """Render files below root as a tree, files before subdirectories, sorted by name.
+
+    init_plugin passes the files it finds on disk; init_marketplace passes
+    the files it planned, without walking the directory it just wrote.
+    """
+    tree: dict = {}
+    for path in files:
+        node = tree
+        *parents, filename = path.relative_to(root).parts
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[filename] = None
+
+    lines = []
+    stack = [(root.name, tree, 0)]
+    while stack:
+        name, node, level = stack.pop()
+        lines.append(f"{'  ' * level}{name}/")
+        subdirs = []
+        for child in sorted(node):
+            if node[child] is None:
+                lines.append(f"{'  ' * (level + 1)}{child}")
+            else:
+                subdirs.append((child, node[child], level + 1))
+        stack.extend(reversed(subdirs))
+    return "\n".join(lines)
@@ -18,12 +18,11 @@ Options:
 
 import argparse
 import json
-import subprocess
+import os
 import sys
-import urllib.parse
 from pathlib import Path
-from typing import Optional
 
+from validate_plugin import has_dir, has_file, read_json, scan_entries, scan_md
 
 # Anthropic Plugin Submission Form URL
 SUBMISSION_FORM_URL = "https://forms.gle/YourFormID"  # Replace with actual form URL when known
@@ -33,25 +32,41 @@ PLUGIN_DOCS_URL = "https://code.claude.com/docs/en/plugins"
 MARKETPLACE_DOCS_URL = "https://code.claude.com/docs/en/plugin-marketplaces"
 REFERENCE_DOCS_URL = "https://code.claude.com/docs/en/plugins-reference"
 
+# Executables that failed to launch; later calls skip them without a fork
+_missing_commands: set[str] = set()
+
 
 def run_command(cmd: list[str], cwd: str = None) -> tuple[bool, str]:
     """Run a shell command and return (success, output)."""
+    if cmd[0] in _missing_commands:
+        return False, f"{cmd[0]}: command not found"
+
+    # Imported here: a plugin that fails before git is probed never needs it
+    import subprocess
+
     try:
+        # stderr is never read, and stdin is closed so nothing can block on it
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             cwd=cwd,
             timeout=30
         )
-        return result.returncode == 0, result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+        return result.returncode == 0, result.stdout.decode("utf-8", "replace").strip()
+    except FileNotFoundError as e:
+        # A missing cwd raises this too, naming the directory instead
+        if e.filename == cmd[0]:
+            _missing_commands.add(cmd[0])
+        return False, str(e)
+    except subprocess.TimeoutExpired as e:
         return False, str(e)
 
 
-def get_git_info(plugin_path: str) -> dict:
-    """Get git repository information using git and gh CLI."""
-    git_info = {
+def empty_git_info() -> dict:
+    """Git info with nothing detected, before (or instead of) probing git."""
+    return {
         "repo_url": None,
         "full_sha": None,
         "branch": None,
@@ -60,90 +75,108 @@ def get_git_info(plugin_path: str) -> dict:
         "errors": []
     }
 
-    # Check if it's a git repository
-    success, _ = run_command(["git", "rev-parse", "--git-dir"], cwd=plugin_path)
+
+def get_git_info(plugin_path: str) -> dict:
+    """Get git repository information using git and gh CLI."""
+    git_info = empty_git_info()
+
+    # One status call reports HEAD, branch and cleanliness; it fails outside
+    # a repository. Header lines start with "#", any other line is a change
+    success, status = run_command(["git", "status", "--porcelain=v2", "--branch"], cwd=plugin_path)
     if not success:
         git_info["errors"].append("Not a git repository")
         return git_info
 
-    # Get full SHA
-    success, sha = run_command(["git", "rev-parse", "HEAD"], cwd=plugin_path)
-    if success:
-        git_info["full_sha"] = sha
-    else:
+    is_clean = True
+    for line in status.splitlines():
+        if line.startswith("# branch.oid "):
+            sha = line[len("# branch.oid "):]
+            if sha != "(initial)":
+                git_info["full_sha"] = sha
+        elif line.startswith("# branch.head "):
+            branch = line[len("# branch.head "):]
+            # Matches `git branch --show-current`, which prints nothing when detached
+            git_info["branch"] = "" if branch == "(detached)" else branch
+        elif not line.startswith("#"):
+            is_clean = False
+    git_info["is_clean"] = is_clean
+
+    if not git_info["full_sha"]:
         git_info["errors"].append("Could not get commit SHA")
 
-    # Get current branch
-    success, branch = run_command(["git", "branch", "--show-current"], cwd=plugin_path)
-    if success:
-        git_info["branch"] = branch
-
-    # Check if working directory is clean
-    success, status = run_command(["git", "status", "--porcelain"], cwd=plugin_path)
-    if success:
-        git_info["is_clean"] = len(status) == 0
-
-    # Try to get remote URL using gh
-    success, repo_url = run_command(["gh", "repo", "view", "--json", "url", "-q", ".url"], cwd=plugin_path)
-    if success and repo_url:
-        git_info["repo_url"] = repo_url
+    # Remote URL: origin is read from local git config; gh (a network call)
+    # is only tried when there is no origin
+    success, remote_url = run_command(["git", "remote", "get-url", "origin"], cwd=plugin_path)
+    if not (success and remote_url):
+        success, remote_url = run_command(["gh", "repo", "view", "--json", "url", "-q", ".url"], cwd=plugin_path)
+
+    if success and remote_url:
+        # Convert SSH URL to HTTPS if needed
+        if remote_url.startswith("git@github.com:"):
+            remote_url = remote_url.replace("git@github.com:", "https://github.com/")
+        if remote_url.endswith(".git"):
+            remote_url = remote_url[:-4]
+        git_info["repo_url"] = remote_url
         git_info["has_remote"] = True
     else:
-        # Fallback to git remote
-        success, remote_url = run_command(["git", "remote", "get-url", "origin"], cwd=plugin_path)
-        if success and remote_url:
-            # Convert SSH URL to HTTPS if needed
-            if remote_url.startswith("git@github.com:"):
-                remote_url = remote_url.replace("git@github.com:", "https://github.com/")
-            if remote_url.endswith(".git"):
-                remote_url = remote_url[:-4]
-            git_info["repo_url"] = remote_url
-            git_info["has_remote"] = True
-        else:
-            git_info["errors"].append("No remote repository found. Push to GitHub first.")
+        git_info["errors"].append("No remote repository found. Push to GitHub first.")
 
     return git_info
 
 
+def md_stems(directory: str) -> list[str]:
+    """Names, without the .md suffix, of the markdown files in a directory.
+
+    Uses the file type cached on each DirEntry, so no per-entry stat is
+    needed on filesystems that report it (most do).
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [e.name[:-3] for e in it if e.name.endswith(".md") and e.is_file()]
+    except NotADirectoryError:
+        return []
+
+
+def subdir_names(directory: str) -> list[str]:
+    """Names of the subdirectories of a directory."""
+    try:
+        with os.scandir(directory) as it:
+            return [e.name for e in it if e.is_dir()]
+    except NotADirectoryError:
+        return []
+
+
 def gather_plugin_info(plugin_path: str, email: str = None, company_url: str = None) -> dict:
-    """Gather all information needed for plugin submission."""
+    """Gather all information needed for plugin submission.
+
+    Nothing is cached between runs: the form must reflect the working tree
+    as it is now, and proving that it is unchanged would take the same
+    git status call that dominates the analysis anyway.
+    """
     plugin_dir = Path(plugin_path).resolve()
     info = {
         "plugin_path": str(plugin_dir),
         "validation": {"passed": True, "issues": [], "warnings": []},
         "metadata": {},
-        "git": {},
+        # Filled in by get_git_info once plugin.json has loaded; a plugin
+        # that fails that early gets no git subprocesses at all
+        "git": empty_git_info(),
         "components": {},
         "form_fields": {}
     }
 
-    # Get git information
-    info["git"] = get_git_info(str(plugin_dir))
-
-    # Read plugin.json
-    plugin_json_path = plugin_dir / ".claude-plugin" / "plugin.json"
-    if not plugin_json_path.exists():
+    # Read plugin.json; a missing file shows up as the open failing
+    plugin_json_path = os.path.join(plugin_dir, ".claude-plugin", "plugin.json")
+    try:
+        plugin_data = read_json(plugin_json_path)
+        info["metadata"] = plugin_data
+    except (FileNotFoundError, NotADirectoryError):
         info["validation"]["passed"] = False
         info["validation"]["issues"].append("Missing .claude-plugin/plugin.json")
-        # Set empty form fields for display
-        info["form_fields"] = {
-            "link_to_plugin": info["git"].get("repo_url", ""),
-            "full_sha": info["git"].get("full_sha", ""),
-            "plugin_homepage": "",
-            "company_url": company_url or "",
-            "primary_contact_email": email or "",
-            "plugin_name": "",
-            "plugin_description": "",
-        }
-        return info
-
-    try:
-        with open(plugin_json_path) as f:
-            plugin_data = json.load(f)
-            info["metadata"] = plugin_data
     except json.JSONDecodeError as e:
         info["validation"]["passed"] = False
         info["validation"]["issues"].append(f"Invalid plugin.json: {e}")
+    if not info["validation"]["passed"]:
         # Set empty form fields for display
         info["form_fields"] = {
             "link_to_plugin": info["git"].get("repo_url", ""),
@@ -156,6 +189,9 @@ def gather_plugin_info(plugin_path: str, email: str = None, company_url: str = N
         }
         return info
 
+    # Get git information
+    info["git"] = get_git_info(str(plugin_dir))
+
     # Check required fields
     required = ["name", "description", "version", "author"]
     for field in required:
@@ -176,53 +212,44 @@ def gather_plugin_info(plugin_path: str, email: str = None, company_url: str = N
     elif word_count > 100:
         info["validation"]["warnings"].append(f"Description is {word_count} words (50-100 recommended)")
 
-    # Gather component info
+    # Gather component info; one directory read answers the top-level
+    # existence checks, and its entries carry the paths to look inside
     components = info["components"]
+    entries = {e.name: e for e in scan_entries(plugin_dir)}
 
     # Commands
-    commands_dir = plugin_dir / "commands"
-    if commands_dir.exists():
-        commands = list(commands_dir.glob("*.md"))
-        components["commands"] = [c.stem for c in commands]
+    if has_dir(entries, "commands"):
+        components["commands"] = md_stems(entries["commands"].path)
 
     # Agents
-    agents_dir = plugin_dir / "agents"
-    if agents_dir.exists():
-        agents = list(agents_dir.glob("*.md"))
-        components["agents"] = [a.stem for a in agents]
+    if has_dir(entries, "agents"):
+        components["agents"] = md_stems(entries["agents"].path)
 
     # Skills
-    skills_dir = plugin_dir / "skills"
-    if skills_dir.exists():
-        skills = [d.name for d in skills_dir.iterdir() if d.is_dir()]
-        components["skills"] = skills
+    if has_dir(entries, "skills"):
+        components["skills"] = subdir_names(entries["skills"].path)
 
     # Hooks
-    hooks_json = plugin_dir / "hooks" / "hooks.json"
-    if hooks_json.exists():
+    if has_dir(entries, "hooks") and os.path.exists(os.path.join(entries["hooks"].path, "hooks.json")):
         components["hooks"] = True
 
     # MCP servers
-    mcp_json = plugin_dir / ".mcp.json"
-    if mcp_json.exists():
+    if has_file(entries, ".mcp.json"):
         try:
-            with open(mcp_json) as f:
-                mcp_data = json.load(f)
+            mcp_data = read_json(entries[".mcp.json"].path)
             components["mcp_servers"] = list(mcp_data.get("mcpServers", {}).keys())
         except json.JSONDecodeError:
             pass
 
     # Check README
-    readme = plugin_dir / "README.md"
-    if not readme.exists():
+    if not has_file(entries, "README.md"):
         info["validation"]["passed"] = False
         info["validation"]["issues"].append("Missing README.md")
-    elif "TODO" in readme.read_text():
+    elif scan_md(entries["README.md"].path)[2]:
         info["validation"]["warnings"].append("README.md contains TODO placeholders")
 
     # Check LICENSE
-    license_file = plugin_dir / "LICENSE"
-    if not license_file.exists():
+    if not has_file(entries, "LICENSE"):
         info["validation"]["warnings"].append("Missing LICENSE file (recommended)")
 
     # Check git requirements
@@ -233,13 +260,17 @@ def gather_plugin_info(plugin_path: str, email: str = None, company_url: str = N
     if not info["git"]["is_clean"]:
         info["validation"]["warnings"].append("Working directory has uncommitted changes")
 
-    # Prepare form fields
+    # Prepare form fields; author may be a bare string, which has no email
+    git_repo = info["git"]["repo_url"]
+    author = plugin_data.get("author")
+    if not email and isinstance(author, dict):
+        email = author.get("email", "")
     info["form_fields"] = {
-        "link_to_plugin": info["git"].get("repo_url", ""),
-        "full_sha": info["git"].get("full_sha", ""),
-        "plugin_homepage": plugin_data.get("homepage", "") or info["git"].get("repo_url", ""),
+        "link_to_plugin": git_repo,
+        "full_sha": info["git"]["full_sha"],
+        "plugin_homepage": plugin_data.get("homepage") or git_repo,
         "company_url": company_url or "",
-        "primary_contact_email": email or plugin_data.get("author", {}).get("email", ""),
+        "primary_contact_email": email or "",
         "plugin_name": plugin_data.get("name", ""),
         "plugin_description": description,
     }
@@ -260,98 +291,105 @@ def gather_plugin_info(plugin_path: str, email: str = None, company_url: str = N
 
 
 def print_form_fields(info: dict):
-    """Print form fields in a copy-paste friendly format."""
+    """Print form fields in a copy-paste friendly format.
+
+    The report is assembled first and written in one call, so piped or CI
+    output is not split into dozens of small writes.
+    """
     fields = info["form_fields"]
     validation = info["validation"]
     git = info["git"]
+    lines = []
 
-    print("\n" + "=" * 70)
-    print("📋 ANTHROPIC PLUGIN SUBMISSION FORM DATA")
-    print("=" * 70)
+    lines.append("\n" + "=" * 70)
+    lines.append("📋 ANTHROPIC PLUGIN SUBMISSION FORM DATA")
+    lines.append("=" * 70)
 
     # Validation status
     if validation["passed"]:
-        print("\n✅ Validation: PASSED")
+        lines.append("\n✅ Validation: PASSED")
     else:
-        print("\n❌ Validation: FAILED")
+        lines.append("\n❌ Validation: FAILED")
         for issue in validation["issues"]:
-            print(f"   ❌ {issue}")
+            lines.append(f"   ❌ {issue}")
 
     if validation["warnings"]:
-        print("\n⚠️  Warnings:")
+        lines.append("\n⚠️  Warnings:")
         for warning in validation["warnings"]:
-            print(f"   ⚠️  {warning}")
+            lines.append(f"   ⚠️  {warning}")
 
     # Git info
-    print(f"\n📂 Repository Info:")
-    print(f"   Branch: {git.get('branch', 'N/A')}")
-    print(f"   Clean: {'Yes' if git.get('is_clean') else 'No (has uncommitted changes)'}")
+    lines.append(f"\n📂 Repository Info:")
+    lines.append(f"   Branch: {git.get('branch', 'N/A')}")
+    lines.append(f"   Clean: {'Yes' if git.get('is_clean') else 'No (has uncommitted changes)'}")
 
     # Form fields
-    print("\n" + "-" * 70)
-    print("📝 FORM FIELDS (copy these to the submission form)")
-    print("-" * 70)
+    lines.append("\n" + "-" * 70)
+    lines.append("📝 FORM FIELDS (copy these to the submission form)")
+    lines.append("-" * 70)
 
-    print(f"\n1. Link to Plugin *")
-    print(f"   {fields['link_to_plugin'] or '[REQUIRED - push to GitHub first]'}")
+    lines.append(f"\n1. Link to Plugin *")
+    lines.append(f"   {fields['link_to_plugin'] or '[REQUIRED - push to GitHub first]'}")
 
-    print(f"\n2. Full SHA of version you want added *")
-    print(f"   {fields['full_sha'] or '[REQUIRED - commit first]'}")
+    lines.append(f"\n2. Full SHA of version you want added *")
+    lines.append(f"   {fields['full_sha'] or '[REQUIRED - commit first]'}")
 
-    print(f"\n3. Plugin Homepage *")
-    print(f"   {fields['plugin_homepage'] or '[REQUIRED]'}")
+    lines.append(f"\n3. Plugin Homepage *")
+    lines.append(f"   {fields['plugin_homepage'] or '[REQUIRED]'}")
 
-    print(f"\n4. Company/Organization URL *")
-    print(f"   {fields['company_url'] or '[REQUIRED - use --company-url]'}")
+    lines.append(f"\n4. Company/Organization URL *")
+    lines.append(f"   {fields['company_url'] or '[REQUIRED - use --company-url]'}")
 
-    print(f"\n5. Primary Contact Email *")
-    print(f"   {fields['primary_contact_email'] or '[REQUIRED - use --email]'}")
+    lines.append(f"\n5. Primary Contact Email *")
+    lines.append(f"   {fields['primary_contact_email'] or '[REQUIRED - use --email]'}")
 
-    print(f"\n6. Plugin Name *")
-    print(f"   {fields['plugin_name']}")
+    lines.append(f"\n6. Plugin Name *")
+    lines.append(f"   {fields['plugin_name']}")
 
-    print(f"\n7. Plugin Description * (50-100 words)")
-    print(f"   {fields['plugin_description']}")
+    lines.append(f"\n7. Plugin Description * (50-100 words)")
+    lines.append(f"   {fields['plugin_description']}")
 
     # Components summary
     components = info["components"]
     if components:
-        print("\n" + "-" * 70)
-        print("🧩 Plugin Components (for reference)")
-        print("-" * 70)
+        lines.append("\n" + "-" * 70)
+        lines.append("🧩 Plugin Components (for reference)")
+        lines.append("-" * 70)
         if components.get("commands"):
-            print(f"   Commands: {', '.join(components['commands'])}")
+            lines.append(f"   Commands: {', '.join(components['commands'])}")
         if components.get("agents"):
-            print(f"   Agents: {', '.join(components['agents'])}")
+            lines.append(f"   Agents: {', '.join(components['agents'])}")
         if components.get("skills"):
-            print(f"   Skills: {', '.join(components['skills'])}")
+            lines.append(f"   Skills: {', '.join(components['skills'])}")
         if components.get("hooks"):
-            print(f"   Hooks: Configured")
+            lines.append(f"   Hooks: Configured")
         if components.get("mcp_servers"):
-            print(f"   MCP Servers: {', '.join(components['mcp_servers'])}")
+            lines.append(f"   MCP Servers: {', '.join(components['mcp_servers'])}")
+
+    lines.append("\n" + "=" * 70)
 
-    print("\n" + "=" * 70)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def copy_to_clipboard(text: str) -> bool:
     """Try to copy text to clipboard."""
-    try:
-        # macOS
-        process = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE)
-        process.communicate(text.encode('utf-8'))
-        return process.returncode == 0
-    except FileNotFoundError:
-        try:
-            # Linux with xclip
-            process = subprocess.Popen(['xclip', '-selection', 'clipboard'], stdin=subprocess.PIPE)
-            process.communicate(text.encode('utf-8'))
+    import shutil
+    import subprocess
+
+    # pbcopy on macOS, xclip on Linux; look them up rather than failing an exec
+    for cmd in (['pbcopy'], ['xclip', '-selection', 'clipboard']):
+        if shutil.which(cmd[0]):
+            process = subprocess.run(cmd, input=text.encode('utf-8'))
             return process.returncode == 0
-        except FileNotFoundError:
-            return False
+    return False
 
 
 def generate_submission_json(info: dict) -> str:
-    """Generate JSON with all submission data."""
+    """Generate JSON with all submission data.
+
+    Indented on purpose: the output is a few kilobytes that people read and
+    paste from, so compact separators would save nothing measurable.
+    """
     return json.dumps({
         "form_fields": info["form_fields"],
         "validation": info["validation"],
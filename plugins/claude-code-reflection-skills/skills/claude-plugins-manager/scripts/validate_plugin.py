@@ -8,10 +8,17 @@ Usage:
 
 import argparse
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, List, Tuple
+
+# Kebab-case plugin name, e.g. "my-plugin"
+PLUGIN_NAME_RE = re.compile(r'^[a-z][a-z0-9-]*[a-z0-9]$|^[a-z]$')
+# Semantic version with optional pre-release and build metadata
+VERSION_RE = re.compile(r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?$')
 
 
 class ValidationResult:
@@ -34,32 +41,35 @@ class ValidationResult:
         return len(self.errors) == 0
 
     def print_report(self):
+        lines = []
         if self.info:
-            print("\n📋 Info:")
+            lines.append("\n📋 Info:")
             for msg in self.info:
-                print(f"   {msg}")
+                lines.append(f"   {msg}")
 
         if self.warnings:
-            print("\n⚠️  Warnings:")
+            lines.append("\n⚠️  Warnings:")
             for msg in self.warnings:
-                print(f"   {msg}")
+                lines.append(f"   {msg}")
 
         if self.errors:
-            print("\n❌ Errors:")
+            lines.append("\n❌ Errors:")
             for msg in self.errors:
-                print(f"   {msg}")
+                lines.append(f"   {msg}")
 
         if self.is_valid:
-            print("\n✅ Plugin is valid!")
+            lines.append("\n✅ Plugin is valid!")
         else:
-            print(f"\n❌ Plugin validation failed with {len(self.errors)} error(s)")
+            lines.append(f"\n❌ Plugin validation failed with {len(self.errors)} error(s)")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def validate_plugin_name(name: str) -> Tuple[bool, str]:
     """Validate plugin name format (kebab-case)."""
     if not name:
         return False, "Plugin name is empty"
-    if not re.match(r'^[a-z][a-z0-9-]*[a-z0-9]$|^[a-z]$', name):
+    if not PLUGIN_NAME_RE.match(name):
         return False, f"Plugin name '{name}' should be kebab-case (e.g., 'my-plugin')"
     if '--' in name:
         return False, f"Plugin name '{name}' should not have consecutive dashes"
@@ -68,13 +78,110 @@ def validate_plugin_name(name: str) -> Tuple[bool, str]:
 
 def validate_version(version: str) -> Tuple[bool, str]:
     """Validate semantic version format."""
-    if not re.match(r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?$', version):
+    if not VERSION_RE.match(version):
         return False, f"Version '{version}' should follow semver (e.g., '1.0.0')"
     return True, ""
 
 
+def scan_entries(directory: str | os.PathLike) -> list[os.DirEntry]:
+    """List a directory with os.scandir; empty if it is not a directory.
+
+    DirEntry caches the file type from the directory read, so filtering on
+    is_file()/is_dir() needs no per-entry stat on most filesystems.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except NotADirectoryError:
+        return []
+
+
+def read_json(path: str | os.PathLike) -> Any:
+    """Read and parse a JSON file.
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
+def has_dir(entries: dict[str, os.DirEntry], name: str) -> bool:
+    """Whether a scanned directory has a subdirectory called name."""
+    entry = entries.get(name)
+    return entry is not None and entry.is_dir()
+
+
+def has_file(entries: dict[str, os.DirEntry], name: str) -> bool:
+    """Whether a scanned directory has a file called name."""
+    entry = entries.get(name)
+    return entry is not None and entry.is_file()
+
+
+def scan_md(path: str | os.PathLike, find_todo: bool = True) -> tuple[bool, bool, bool]:
+    """Check a markdown file's frontmatter and look for TODO markers.
+
+    The file is read as bytes in 64 KB chunks and never decoded or held
+    whole. Reading stops once the frontmatter has closed and, if find_todo
+    is set, a TODO has been seen.
+
+    Returns:
+        Tuple of (has_frontmatter, has_description, has_todo).
+        has_description means "description:" appears between the opening
+        "---" and the next one; has_todo is False when find_todo is not set
+    """
+    with open(path, "rb") as f:
+        chunk = f.read(65536)
+        has_frontmatter = chunk.startswith(b"---")
+        header = chunk if has_frontmatter else b""
+        header_end = -1
+        has_todo = False
+        tail = b""
+        while chunk:
+            if find_todo and not has_todo:
+                # tail carries the last 3 bytes so a TODO split across
+                # chunks is still found
+                has_todo = b"TODO" in chunk or b"TODO" in tail + chunk[:3]
+                tail = chunk[-3:]
+            if has_frontmatter and header_end == -1:
+                header_end = header.find(b"---", 3)
+            header_done = not has_frontmatter or header_end != -1
+            if header_done and (has_todo or not find_todo):
+                break
+            chunk = f.read(65536)
+            if not header_done:
+                header += chunk
+
+    if has_frontmatter and header_end == -1:
+        header_end = len(header)
+    has_description = b"description:" in header[3:header_end]
+    return has_frontmatter, has_description, has_todo
+
+
+def scan_md_files(md_files: list[os.DirEntry]) -> list[tuple[bool, bool, bool]]:
+    """Scan the frontmatter of several markdown files concurrently.
+
+    Results keep the input order, so findings are still reported in order
+    from the calling thread. A handful of files is not worth a pool.
+    """
+    if len(md_files) <= 2:
+        return [scan_md(f, find_todo=False) for f in md_files]
+    with ThreadPoolExecutor(max_workers=min(8, len(md_files))) as executor:
+        return list(executor.map(lambda f: scan_md(f, find_todo=False), md_files))
+
+
 def validate_plugin_json(plugin_dir: Path, result: ValidationResult) -> dict | None:
-    """Validate plugin.json exists and has required fields."""
+    """Validate plugin.json exists and has required fields.
+
+    The manifest is parsed whole even though only a few keys are checked:
+    a syntax error anywhere in it must be reported, which a parser that
+    stops after the wanted keys would miss.
+
+    Args:
+        plugin_dir: Plugin root directory
+        result: Collects errors, warnings and info
+    """
     plugin_json_path = plugin_dir / ".claude-plugin" / "plugin.json"
 
     if not plugin_json_path.exists():
@@ -82,8 +189,7 @@ def validate_plugin_json(plugin_dir: Path, result: ValidationResult) -> dict | N
         return None
 
     try:
-        with open(plugin_json_path) as f:
-            plugin_data = json.load(f)
+        plugin_data = read_json(plugin_json_path)
     except json.JSONDecodeError as e:
         result.add_error(f"Invalid JSON in plugin.json: {e}")
         return None
@@ -131,58 +237,56 @@ def validate_plugin_json(plugin_dir: Path, result: ValidationResult) -> dict | N
     return plugin_data
 
 
-def validate_commands(plugin_dir: Path, result: ValidationResult):
+def validate_commands(plugin_dir: Path, result: ValidationResult, entries: dict[str, os.DirEntry]):
     """Validate commands directory and files."""
-    commands_dir = plugin_dir / "commands"
-    if not commands_dir.exists():
+    if not has_dir(entries, "commands"):
         return
+    commands_dir = entries["commands"].path
 
-    md_files = list(commands_dir.glob("*.md"))
+    md_files = [e for e in scan_entries(commands_dir) if e.name.endswith(".md") and e.is_file()]
     if not md_files:
         result.add_warning("commands/ directory exists but contains no .md files")
         return
 
     result.add_info(f"Found {len(md_files)} command(s)")
 
-    for md_file in md_files:
-        content = md_file.read_text()
+    for md_file, (has_frontmatter, has_description, _) in zip(md_files, scan_md_files(md_files)):
 
         # Check for frontmatter
-        if not content.startswith("---"):
+        if not has_frontmatter:
             result.add_warning(f"Command '{md_file.name}' missing YAML frontmatter")
             continue
 
         # Check for description in frontmatter
-        if "description:" not in content.split("---")[1] if len(content.split("---")) > 1 else "":
+        if not has_description:
             result.add_warning(f"Command '{md_file.name}' missing description in frontmatter")
 
 
-def validate_agents(plugin_dir: Path, result: ValidationResult):
+def validate_agents(plugin_dir: Path, result: ValidationResult, entries: dict[str, os.DirEntry]):
     """Validate agents directory and files."""
-    agents_dir = plugin_dir / "agents"
-    if not agents_dir.exists():
+    if not has_dir(entries, "agents"):
         return
+    agents_dir = entries["agents"].path
 
-    md_files = list(agents_dir.glob("*.md"))
+    md_files = [e for e in scan_entries(agents_dir) if e.name.endswith(".md") and e.is_file()]
     if not md_files:
         result.add_warning("agents/ directory exists but contains no .md files")
         return
 
     result.add_info(f"Found {len(md_files)} agent(s)")
 
-    for md_file in md_files:
-        content = md_file.read_text()
-        if not content.startswith("---"):
+    for md_file, (has_frontmatter, _, _) in zip(md_files, scan_md_files(md_files)):
+        if not has_frontmatter:
             result.add_warning(f"Agent '{md_file.name}' missing YAML frontmatter")
 
 
-def validate_skills(plugin_dir: Path, result: ValidationResult):
+def validate_skills(plugin_dir: Path, result: ValidationResult, entries: dict[str, os.DirEntry]):
     """Validate skills directory structure."""
-    skills_dir = plugin_dir / "skills"
-    if not skills_dir.exists():
+    if not has_dir(entries, "skills"):
         return
+    skills_dir = entries["skills"].path
 
-    skill_dirs = [d for d in skills_dir.iterdir() if d.is_dir()]
+    skill_dirs = [e for e in scan_entries(skills_dir) if e.is_dir()]
     if not skill_dirs:
         result.add_warning("skills/ directory exists but contains no skill subdirectories")
         return
@@ -190,25 +294,26 @@ def validate_skills(plugin_dir: Path, result: ValidationResult):
     result.add_info(f"Found {len(skill_dirs)} skill(s)")
 
     for skill_dir in skill_dirs:
-        skill_md = skill_dir / "SKILL.md"
-        if not skill_md.exists():
+        # One readdir per skill answers both "is SKILL.md there" and "is it empty"
+        names = {e.name for e in scan_entries(skill_dir.path)}
+        if not names:
+            result.add_warning(f"Skill '{skill_dir.name}' directory is empty")
+        if "SKILL.md" not in names:
             result.add_error(f"Skill '{skill_dir.name}' missing SKILL.md")
 
 
-def validate_hooks(plugin_dir: Path, result: ValidationResult):
+def validate_hooks(plugin_dir: Path, result: ValidationResult, entries: dict[str, os.DirEntry]):
     """Validate hooks configuration."""
-    hooks_dir = plugin_dir / "hooks"
-    if not hooks_dir.exists():
+    if not has_dir(entries, "hooks"):
         return
 
-    hooks_json = hooks_dir / "hooks.json"
-    if not hooks_json.exists():
+    hooks_json = os.path.join(entries["hooks"].path, "hooks.json")
+    if not os.path.exists(hooks_json):
         result.add_warning("hooks/ directory exists but missing hooks.json")
         return
 
     try:
-        with open(hooks_json) as f:
-            hooks_data = json.load(f)
+        hooks_data = read_json(hooks_json)
         result.add_info("Found hooks configuration")
         events = hooks_data.get("hooks", hooks_data)
         if not isinstance(events, dict):
@@ -236,15 +341,14 @@ def validate_hooks(plugin_dir: Path, result: ValidationResult):
         result.add_error(f"Invalid JSON in hooks.json: {e}")
 
 
-def validate_mcp(plugin_dir: Path, result: ValidationResult):
+def validate_mcp(plugin_dir: Path, result: ValidationResult, entries: dict[str, os.DirEntry]):
     """Validate MCP server configuration."""
-    mcp_json = plugin_dir / ".mcp.json"
-    if not mcp_json.exists():
+    if not has_file(entries, ".mcp.json"):
         return
+    mcp_json = entries[".mcp.json"].path
 
     try:
-        with open(mcp_json) as f:
-            mcp_data = json.load(f)
+        mcp_data = read_json(mcp_json)
 
         if "mcpServers" not in mcp_data:
             result.add_error(".mcp.json missing 'mcpServers' key")
@@ -261,24 +365,25 @@ def validate_mcp(plugin_dir: Path, result: ValidationResult):
         result.add_error(f"Invalid JSON in .mcp.json: {e}")
 
 
-def validate_readme(plugin_dir: Path, result: ValidationResult):
+def validate_readme(plugin_dir: Path, result: ValidationResult, entries: dict[str, os.DirEntry]):
     """Validate README.md exists and has content."""
-    readme = plugin_dir / "README.md"
-    if not readme.exists():
+    if not has_file(entries, "README.md"):
         result.add_error("Missing README.md")
         return
+    readme = entries["README.md"].path
 
-    content = readme.read_text()
-    if len(content) < 100:
+    # UTF-8 needs at most 4 bytes per character, so only a small file can
+    # be under 100 characters and needs decoding to tell
+    if entries["README.md"].stat().st_size < 400 and len(Path(readme).read_text()) < 100:
         result.add_warning("README.md is very short, consider adding more documentation")
-    if "TODO" in content:
+    _, _, has_todo = scan_md(readme)
+    if has_todo:
         result.add_warning("README.md contains TODO placeholders")
 
 
-def validate_license(plugin_dir: Path, result: ValidationResult):
+def validate_license(plugin_dir: Path, result: ValidationResult, entries: dict[str, os.DirEntry]):
     """Check for LICENSE file."""
-    license_file = plugin_dir / "LICENSE"
-    if not license_file.exists():
+    if not has_file(entries, "LICENSE"):
         result.add_warning("Missing LICENSE file (recommended for distribution)")
 
 
@@ -287,23 +392,26 @@ def validate_plugin(plugin_path: str) -> ValidationResult:
     result = ValidationResult()
     plugin_dir = Path(plugin_path).resolve()
 
-    if not plugin_dir.exists():
+    # One directory read answers every top-level existence check below
+    try:
+        with os.scandir(plugin_dir) as it:
+            entries = {e.name: e for e in it}
+    except FileNotFoundError:
         result.add_error(f"Plugin directory does not exist: {plugin_dir}")
         return result
-
-    if not plugin_dir.is_dir():
+    except NotADirectoryError:
         result.add_error(f"Path is not a directory: {plugin_dir}")
         return result
 
     # Run all validators
     validate_plugin_json(plugin_dir, result)
-    validate_commands(plugin_dir, result)
-    validate_agents(plugin_dir, result)
-    validate_skills(plugin_dir, result)
-    validate_hooks(plugin_dir, result)
-    validate_mcp(plugin_dir, result)
-    validate_readme(plugin_dir, result)
-    validate_license(plugin_dir, result)
+    validate_commands(plugin_dir, result, entries)
+    validate_agents(plugin_dir, result, entries)
+    validate_skills(plugin_dir, result, entries)
+    validate_hooks(plugin_dir, result, entries)
+    validate_mcp(plugin_dir, result, entries)
+    validate_readme(plugin_dir, result, entries)
+    validate_license(plugin_dir, result, entries)
 
     return result
 
@@ -3,8 +3,8 @@
 
 import os
 import sys
-import argparse
-from pathlib import Path
+
+from subagent_common import get_agents_dir
 
 TEMPLATE = '''---
 name: {name}
@@ -25,6 +25,9 @@ AVAILABLE_MODELS = ["sonnet", "opus", "haiku", "inherit"]
 
 PERMISSION_MODES = ["default", "acceptEdits", "dontAsk", "bypassPermissions", "plan"]
 
+# Deletes the separators allowed in a name, leaving what must be alphanumeric
+NAME_SEPARATORS = str.maketrans("", "", "-_")
+
 def create_subagent(
     name: str,
     description: str,
@@ -54,51 +57,42 @@ def create_subagent(
         Path to created file
     """
     # Validate name format
-    if not name.replace("-", "").replace("_", "").isalnum():
+    if not name.translate(NAME_SEPARATORS).isalnum():
         raise ValueError(f"Invalid name '{name}'. Use lowercase letters, numbers, and hyphens.")
 
     # Determine target directory
-    if scope == "user":
-        agents_dir = Path.home() / ".claude" / "agents"
-    else:
-        agents_dir = Path.cwd() / ".claude" / "agents"
+    agents_dir = get_agents_dir(scope)
 
     # Create directory if needed
     agents_dir.mkdir(parents=True, exist_ok=True)
 
-    # Check for existing file
     target_file = agents_dir / f"{name}.md"
-    if target_file.exists() and not overwrite:
-        raise FileExistsError(f"Subagent '{name}' already exists at {target_file}. Use --overwrite to replace.")
-
-    # Build frontmatter
-    frontmatter_lines = [
-        "---",
-        f"name: {name}",
-        f"description: {description}",
-    ]
-
-    if tools:
-        frontmatter_lines.append(f"tools: {tools}")
-
-    if disallowed_tools:
-        frontmatter_lines.append(f"disallowedTools: {disallowed_tools}")
 
-    frontmatter_lines.append(f"model: {model}")
-
-    if permission_mode:
-        frontmatter_lines.append(f"permissionMode: {permission_mode}")
-
-    frontmatter_lines.append("---")
-
-    # Combine with prompt
-    content = "\n".join(frontmatter_lines) + "\n\n" + prompt.strip() + "\n"
-
-    # Write file
-    target_file.write_text(content)
+    # Build frontmatter and prompt as one string; optional keys only when set
+    content = (
+        f"---\nname: {name}\ndescription: {description}\n"
+        + (f"tools: {tools}\n" if tools else "")
+        + (f"disallowedTools: {disallowed_tools}\n" if disallowed_tools else "")
+        + f"model: {model}\n"
+        + (f"permissionMode: {permission_mode}\n" if permission_mode else "")
+        + f"---\n\n{prompt.strip()}\n"
+    )
+
+    # Write file; without overwrite, O_EXCL makes the create itself the
+    # existence check (a dangling symlink counts as existing), with no race
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    if not overwrite:
+        flags |= os.O_EXCL
+    try:
+        fd = os.open(target_file, flags, 0o666)
+    except FileExistsError:
+        raise FileExistsError(f"Subagent '{name}' already exists at {target_file}. Use --overwrite to replace.") from None
+    with os.fdopen(fd, "wb") as f:
+        f.write(content.encode("utf-8"))
     return str(target_file)
 
 def main():
+    import argparse
     parser = argparse.ArgumentParser(description="Create a new Claude Code subagent")
     parser.add_argument("name", help="Subagent name (lowercase with hyphens)")
     parser.add_argument("--description", "-d", required=True, help="When to use this subagent")
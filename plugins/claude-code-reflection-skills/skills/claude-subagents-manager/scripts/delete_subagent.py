@@ -1,38 +1,12 @@
 #!/usr/bin/env python3
 """Delete a Claude Code subagent."""
 
-import os
 import sys
-import argparse
 from pathlib import Path
 
-def find_subagent(name: str, scope: str = None) -> tuple:
-    """
-    Find a subagent by name.
-
-    Args:
-        name: Subagent name
-        scope: Optional scope to search ("user", "project", or None for both)
-
-    Returns:
-        Tuple of (scope, path) or (None, None) if not found
-    """
-    user_dir = Path.home() / ".claude" / "agents"
-    project_dir = Path.cwd() / ".claude" / "agents"
-
-    if scope in (None, "project"):
-        project_file = project_dir / f"{name}.md"
-        if project_file.exists():
-            return ("project", project_file)
-
-    if scope in (None, "user"):
-        user_file = user_dir / f"{name}.md"
-        if user_file.exists():
-            return ("user", user_file)
-
-    return (None, None)
+from subagent_common import find_subagent
 
-def delete_subagent(name: str, scope: str = None, force: bool = False) -> str:
+def delete_subagent(name: str, scope: str = None, force: bool = False, path: Path = None) -> str:
     """
     Delete a subagent by name.
 
@@ -40,11 +14,13 @@ def delete_subagent(name: str, scope: str = None, force: bool = False) -> str:
         name: Subagent name
         scope: Optional specific scope ("user" or "project")
         force: Skip confirmation
+        path: Subagent file already found by find_subagent, to skip the lookup
 
     Returns:
         Path of deleted file
     """
-    found_scope, path = find_subagent(name, scope)
+    if path is None:
+        found_scope, path = find_subagent(name, scope)
 
     if not path:
         scope_msg = f" in {scope} scope" if scope else ""
@@ -55,6 +31,7 @@ def delete_subagent(name: str, scope: str = None, force: bool = False) -> str:
     return str(path)
 
 def main():
+    import argparse
     parser = argparse.ArgumentParser(description="Delete a Claude Code subagent")
     parser.add_argument("name", help="Subagent name to delete")
     parser.add_argument("--scope", "-s", choices=["user", "project"],
@@ -74,13 +51,18 @@ def main():
 
     # Confirm unless force
     if not args.force:
-        response = input(f"Delete subagent '{args.name}' from {found_scope} scope? ({path}) [y/N]: ")
+        try:
+            response = input(f"Delete subagent '{args.name}' from {found_scope} scope? ({path}) [y/N]: ")
+        except EOFError:
+            # No terminal to answer from (stdin closed or empty): default to no
+            print()
+            response = ""
         if response.lower() != 'y':
             print("Cancelled.")
             sys.exit(0)
 
     try:
-        deleted_path = delete_subagent(args.name, args.scope, args.force)
+        deleted_path = delete_subagent(args.name, args.scope, args.force, path=path)
         print(f"Deleted subagent: {deleted_path}")
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -1,23 +1,115 @@
 #!/usr/bin/env python3
 """List all Claude Code subagents from user and project scopes."""
 
+import codecs
 import os
 import sys
 import re
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from subagent_common import get_project_agents_dir, get_user_agents_dir
+
+# Frontmatter block at the start of a file
+FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---', re.DOTALL)
+# One frontmatter line, split at its first colon into key and value
+FM_LINE_RE = re.compile(r'^([^:\n]*):(.*)$', re.MULTILINE)
+
+# Frontmatter is read in blocks of HEAD_CHUNK bytes, up to HEAD_LIMIT
+HEAD_CHUNK = 8192
+HEAD_LIMIT = 65536
+
+def read_head(path: str) -> str:
+    """
+    Read the start of a markdown file, as far as its frontmatter needs.
+
+    A file that does not open with "---" has no frontmatter, so one block
+    is enough; otherwise reading stops at the closing "---" (or HEAD_LIMIT),
+    so a long prompt body is never read.
+    """
+    with open(path, "rb") as f:
+        head = f.read(HEAD_CHUNK)
+        if head.startswith(b"---"):
+            # The closing fence cannot start before offset 4 ("---\n")
+            while head.find(b"\n---", 4) == -1 and len(head) < HEAD_LIMIT:
+                chunk = f.read(HEAD_CHUNK)
+                if not chunk:
+                    break
+                head += chunk
+    # An incremental decoder holds back a character cut off at the block
+    # boundary instead of failing on it; invalid bytes still raise
+    return codecs.getincrementaldecoder("utf-8")().decode(head)
 
 def parse_frontmatter(content: str) -> dict:
     """Extract YAML frontmatter from markdown content."""
-    match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
+    match = FRONTMATTER_RE.match(content)
     if not match:
         return {}
 
-    frontmatter = {}
-    for line in match.group(1).strip().split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
-            frontmatter[key.strip()] = value.strip()
-    return frontmatter
+    return {key.strip(): value.strip() for key, value in FM_LINE_RE.findall(match.group(1))}
+
+@lru_cache(maxsize=512)
+def _read_frontmatter(path: str, mtime_ns: int, size: int) -> dict:
+    """Read and parse a file's frontmatter; mtime_ns and size only serve as cache keys."""
+    return parse_frontmatter(read_head(path))
+
+def read_frontmatter(md_file: os.DirEntry) -> dict:
+    """
+    Read and parse a subagent file's frontmatter.
+
+    Results are cached per (path, mtime, size), so a long-lived caller that
+    lists the same directories again only re-reads files that changed.
+    """
+    st = md_file.stat()
+    return dict(_read_frontmatter(md_file.path, st.st_mtime_ns, st.st_size))
+
+def read_frontmatters(md_files: list) -> list:
+    """
+    Read the frontmatter of several subagent files concurrently.
+
+    Results keep the input order; a file that cannot be read yields its
+    exception in place of the dict. A handful of files is not worth a pool.
+    """
+    def read(entry):
+        try:
+            return read_frontmatter(entry)
+        except Exception as e:
+            return e
+
+    if len(md_files) <= 2:
+        return [read(f) for f in md_files]
+    with ThreadPoolExecutor(max_workers=min(8, len(md_files))) as executor:
+        return list(executor.map(read, md_files))
+
+def list_agents_dir(scope_name: str, agents_dir, agents: list):
+    """
+    Append the subagents defined in one agents directory.
+
+    Args:
+        scope_name: "user" or "project", recorded on each entry
+        agents_dir: Directory of subagent .md files; a missing one is skipped
+        agents: List the subagent dicts are appended to
+    """
+    # scandir fails on a missing directory, so that needs no separate stat
+    try:
+        with os.scandir(agents_dir) as it:
+            md_files = [e for e in it if e.name.endswith(".md") and e.is_file()]
+    except FileNotFoundError:
+        return
+
+    for md_file, frontmatter in zip(md_files, read_frontmatters(md_files)):
+        if isinstance(frontmatter, Exception):
+            print(f"Warning: Could not parse {md_file.path}: {frontmatter}", file=sys.stderr)
+            continue
+
+        agents.append({
+            "name": frontmatter.get("name", md_file.name[:-3]),
+            "description": frontmatter.get("description", "No description"),
+            "tools": frontmatter.get("tools", "inherited"),
+            "model": frontmatter.get("model", "sonnet"),
+            "scope": scope_name,
+            "path": md_file.path
+        })
 
 def list_subagents(scope: str = "all") -> list:
     """
@@ -30,36 +122,33 @@ def list_subagents(scope: str = "all") -> list:
         List of dicts with subagent info
     """
     agents = []
-
-    user_dir = Path.home() / ".claude" / "agents"
-    project_dir = Path.cwd() / ".claude" / "agents"
-
-    dirs_to_check = []
     if scope in ("user", "all"):
-        dirs_to_check.append(("user", user_dir))
+        list_agents_dir("user", get_user_agents_dir(), agents)
     if scope in ("project", "all"):
-        dirs_to_check.append(("project", project_dir))
+        list_agents_dir("project", get_project_agents_dir(), agents)
+    return agents
 
-    for scope_name, agents_dir in dirs_to_check:
-        if not agents_dir.exists():
-            continue
+def list_subagents_multi(project_dirs: list, scope: str = "all") -> list:
+    """
+    List subagents for several projects in one process.
+
+    User-scope subagents are listed once, followed by each project's in the
+    order given, so a caller covering many projects pays for one interpreter
+    start instead of one per project.
 
-        for md_file in agents_dir.glob("*.md"):
-            try:
-                content = md_file.read_text()
-                frontmatter = parse_frontmatter(content)
-
-                agents.append({
-                    "name": frontmatter.get("name", md_file.stem),
-                    "description": frontmatter.get("description", "No description"),
-                    "tools": frontmatter.get("tools", "inherited"),
-                    "model": frontmatter.get("model", "sonnet"),
-                    "scope": scope_name,
-                    "path": str(md_file)
-                })
-            except Exception as e:
-                print(f"Warning: Could not parse {md_file}: {e}", file=sys.stderr)
+    Args:
+        project_dirs: Project root directories (each holding .claude/agents)
+        scope: "user", "project", or "all"
 
+    Returns:
+        List of dicts with subagent info
+    """
+    agents = []
+    if scope in ("user", "all"):
+        list_agents_dir("user", get_user_agents_dir(), agents)
+    if scope in ("project", "all"):
+        for project_dir in project_dirs:
+            list_agents_dir("project", os.path.join(os.path.abspath(project_dir), ".claude", "agents"), agents)
     return agents
 
 def main():
@@ -68,13 +157,20 @@ def main():
     parser.add_argument("--scope", choices=["user", "project", "all"], default="all",
                         help="Which scope to list (default: all)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--projects",
+                        help="Comma-separated project directories to list instead of the current one")
     args = parser.parse_args()
 
-    agents = list_subagents(args.scope)
+    if args.projects:
+        agents = list_subagents_multi(
+            [p.strip() for p in args.projects.split(",") if p.strip()], args.scope)
+    else:
+        agents = list_subagents(args.scope)
 
     if args.json:
         import json
-        print(json.dumps(agents, indent=2))
+        json.dump(agents, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
         if not agents:
             print("No subagents found.")
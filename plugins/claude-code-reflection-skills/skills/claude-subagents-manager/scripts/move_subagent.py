@@ -1,33 +1,12 @@
 #!/usr/bin/env python3
 """Move a Claude Code subagent between user and project scopes."""
 
+import errno
 import os
 import sys
 import shutil
-import argparse
-from pathlib import Path
 
-def find_subagent(name: str) -> tuple:
-    """
-    Find a subagent by name across both scopes.
-
-    Returns:
-        Tuple of (scope, path) or (None, None) if not found
-    """
-    user_dir = Path.home() / ".claude" / "agents"
-    project_dir = Path.cwd() / ".claude" / "agents"
-
-    # Check project first (higher priority)
-    project_file = project_dir / f"{name}.md"
-    if project_file.exists():
-        return ("project", project_file)
-
-    # Check user scope
-    user_file = user_dir / f"{name}.md"
-    if user_file.exists():
-        return ("user", user_file)
-
-    return (None, None)
+from subagent_common import find_subagent, get_agents_dir
 
 def move_subagent(name: str, to_scope: str, overwrite: bool = False) -> tuple:
     """
@@ -50,23 +29,28 @@ def move_subagent(name: str, to_scope: str, overwrite: bool = False) -> tuple:
         raise ValueError(f"Subagent '{name}' is already in {to_scope} scope.")
 
     # Determine target
-    if to_scope == "user":
-        target_dir = Path.home() / ".claude" / "agents"
-    else:
-        target_dir = Path.cwd() / ".claude" / "agents"
+    target_dir = get_agents_dir(to_scope)
 
     target_dir.mkdir(parents=True, exist_ok=True)
     target_path = target_dir / f"{name}.md"
 
-    if target_path.exists() and not overwrite:
+    if os.path.lexists(target_path) and not overwrite:
         raise FileExistsError(f"Subagent '{name}' already exists at {target_path}. Use --overwrite to replace.")
 
-    # Move the file
-    shutil.move(str(current_path), str(target_path))
+    # Move the file; both scopes are usually on one filesystem, where a
+    # rename is atomic. Across filesystems, copy then remove the original
+    try:
+        os.replace(current_path, target_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(current_path, target_path)
+        os.unlink(current_path)
 
     return (str(current_path), str(target_path))
 
 def main():
+    import argparse
     parser = argparse.ArgumentParser(description="Move a subagent between user and project scopes")
     parser.add_argument("name", help="Subagent name to move")
     parser.add_argument("--to", "-t", required=True, choices=["user", "project"],
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Shared scope directories and lookup for the Claude Code subagent scripts."""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+# Scopes to search, in priority order, for each --scope value
+SCOPE_SEARCH_ORDER = {
+    None: ("project", "user"),
+    "project": ("project",),
+    "user": ("user",),
+}
+
+@lru_cache(maxsize=1)
+def get_user_agents_dir() -> Path:
+    """Get the user-level agents directory."""
+    return Path.home() / ".claude" / "agents"
+
+@lru_cache(maxsize=1)
+def get_project_agents_dir() -> Path:
+    """Get the project-level agents directory (current working directory)."""
+    return Path.cwd() / ".claude" / "agents"
+
+def get_agents_dir(scope: str) -> Path:
+    """Get the agents directory for "user" or "project" scope."""
+    return get_user_agents_dir() if scope == "user" else get_project_agents_dir()
+
+def find_subagent(name: str, scope: str = None) -> tuple:
+    """
+    Find a subagent by name; project scope takes priority over user scope.
+
+    Args:
+        name: Subagent name
+        scope: Optional scope to search ("user", "project", or None for both)
+
+    Returns:
+        Tuple of (scope, path) or (None, None) if not found
+    """
+    for scope_name in SCOPE_SEARCH_ORDER[scope]:
+        agent_file = get_agents_dir(scope_name) / f"{name}.md"
+        # lexists: one lstat, and a dangling link still counts as present
+        if os.path.lexists(agent_file):
+            return (scope_name, agent_file)
+
+    return (None, None)
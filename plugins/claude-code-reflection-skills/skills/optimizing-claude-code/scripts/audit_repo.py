@@ -19,19 +19,37 @@ import argparse
 import json
 import os
 import re
-import subprocess
+import stat
 import sys
-from dataclasses import asdict, dataclass, field
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 # Regex for @imports (best-effort, ignores inline code spans)
 IMPORT_RE = re.compile(r'(?<!`)\B@([~/.\w\-\s/]+[.\w\-\s/])')
 
+# Markdown ATX heading at the start of a line
+HEADING_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+
+# Directories never walked: VCS metadata, dependencies and build output
+EXCLUDE_DIRS = frozenset({"node_modules", ".git", "dist", "build", ".venv", "__pycache__"})
+
+
+class _Report:
+    """Base for the report dataclasses below."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Fields are scalars or fresh lists of str, so a shallow copy is
+        # enough; asdict would deep-copy every value
+        return dict(self.__dict__)
+
 
 @dataclass
-class MemoryFileReport:
+class MemoryFileReport(_Report):
     path: str
     exists: bool
     bytes: int = 0
@@ -48,7 +66,7 @@ class MemoryFileReport:
 
 
 @dataclass
-class SettingsFileReport:
+class SettingsFileReport(_Report):
     path: str
     exists: bool
     scope: str  # user, project, local, managed
@@ -62,7 +80,7 @@ class SettingsFileReport:
 
 
 @dataclass
-class MCPConfigReport:
+class MCPConfigReport(_Report):
     path: str
     exists: bool
     scope: str  # user or project
@@ -72,7 +90,7 @@ class MCPConfigReport:
 
 
 @dataclass
-class SkillReport:
+class SkillReport(_Report):
     path: str
     name: str
     scope: str  # user or project
@@ -85,7 +103,7 @@ class SkillReport:
 
 
 @dataclass
-class SubagentReport:
+class SubagentReport(_Report):
     path: str
     name: str
     scope: str  # user or project
@@ -94,8 +112,17 @@ class SubagentReport:
     issues: List[str] = field(default_factory=list)
 
 
+@lru_cache(maxsize=1)
+def _home() -> Path:
+    """The user's home directory, looked up once per run."""
+    return Path.home()
+
+
 def _run(cmd: List[str], cwd: Path) -> Tuple[int, str, str]:
     """Run a command and return (returncode, stdout, stderr)."""
+    # Imported here: auditing a directory that is not a git repo never needs it
+    import subprocess
+
     p = subprocess.run(cmd, cwd=str(cwd), text=True, capture_output=True)
     return p.returncode, p.stdout.strip(), p.stderr.strip()
 
@@ -105,25 +132,96 @@ def _is_git_repo(root: Path) -> bool:
 
 
 def _git_tracked_files(root: Path) -> Optional[List[str]]:
-    rc, out, _ = _run(["git", "ls-files"], root)
+    # -z: names come through verbatim instead of C-quoted when unusual
+    rc, out, _ = _run(["git", "ls-files", "-z"], root)
     if rc != 0:
         return None
-    return [line for line in out.splitlines() if line.strip()]
+    return [name for name in out.split("\0") if name.strip()]
 
 
 def _git_last_commit_iso(root: Path, rel_path: str) -> Optional[str]:
-    rc, out, _ = _run(["git", "log", "-1", "--format=%cI", "--", rel_path], root)
+    rc, out, _ = _run(["git", "--literal-pathspecs", "log", "-1", "--format=%cI", "--", rel_path],
+                      root)
     if rc != 0 or not out:
         return None
     return out.splitlines()[0].strip()
 
 
+def _git_last_commit_iso_bulk(root: Path, rel_paths: List[str]) -> Optional[Dict[str, str]]:
+    """Map each path to its newest commit date (%cI) from a single git log.
+
+    History is streamed newest first and git is stopped once every path has
+    been seen, so paths should be tracked ones; any that never appear are
+    left out. Returns None if git fails, so callers can fall back to
+    _git_last_commit_iso.
+
+    Dates match _git_last_commit_iso except where a merge kept one side's
+    version of a path and dropped a newer change from the other side: the
+    single walk still sees that dropped change, git log -1 on the path
+    alone does not.
+    """
+    if not rel_paths:
+        return {}
+
+    import subprocess
+
+    pending = set(rel_paths)
+    found: Dict[str, str] = {}
+    # -z keeps odd file names intact; \x01 marks each commit's date header.
+    # --cc lists a merge's names only where it differs from every parent
+    # (a conflict resolution); otherwise the path is dated by the side
+    # commit that changed it
+    cmd = ["git", "--literal-pathspecs", "log", "-z", "--name-only", "--cc",
+           "--format=%x01%cI", "--", *rel_paths]
+    with subprocess.Popen(cmd, cwd=str(root), stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL) as proc:
+        date = None
+        first_name = False
+        buf = b""
+        for chunk in iter(lambda: proc.stdout.read(65536), b""):
+            *tokens, buf = (buf + chunk).split(b"\0")
+            for tok in tokens:
+                if tok.startswith(b"\x01"):
+                    date = tok[1:].decode()
+                    first_name = True
+                    continue
+                if first_name:
+                    # The name list follows the header after a newline
+                    tok = tok[1:] if tok.startswith(b"\n") else tok
+                    first_name = False
+                name = os.fsdecode(tok)
+                if name in pending:
+                    pending.discard(name)
+                    found[name] = date
+            if not pending:
+                proc.kill()
+                break
+        rc = proc.wait()
+
+    if pending and rc != 0:
+        return None
+    return found
+
+
+def _git_last_commit_iso_each(root: Path, rel_paths: List[str]) -> Dict[str, str]:
+    """Fallback for _git_last_commit_iso_bulk: one git log per path.
+
+    Each call mostly waits on its git process, so they run concurrently.
+    """
+    if len(rel_paths) <= 2:
+        dates = [_git_last_commit_iso(root, rel) for rel in rel_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(rel_paths))) as executor:
+            dates = list(executor.map(lambda rel: _git_last_commit_iso(root, rel), rel_paths))
+    return {rel: date for rel, date in zip(rel_paths, dates) if date}
+
+
 def _safe_read_text(path: Path, max_bytes: int = 2_000_000) -> str:
     """Read file text safely, truncating if too large."""
     try:
-        data = path.read_bytes()
-        if len(data) > max_bytes:
-            data = data[:max_bytes]
+        # Never pull more than max_bytes of an oversized file into memory
+        with open(path, "rb") as f:
+            data = f.read(max_bytes)
         return data.decode("utf-8", errors="replace")
     except Exception:
         return ""
@@ -151,6 +249,8 @@ def _resolve_import(base_dir: Path, raw: str, repo_root: Path) -> Path:
 
 def _extract_imports(text: str) -> List[str]:
     """Extract @import references from text."""
+    if "@" not in text:
+        return []
     found = [m.group(1).strip() for m in IMPORT_RE.finditer(text)]
     # Filter out email-like patterns
     return [x for x in found if "@" not in x]
@@ -158,7 +258,7 @@ def _extract_imports(text: str) -> List[str]:
 
 def _count_headings(text: str) -> int:
     """Count markdown headings."""
-    return len(re.findall(r'^#{1,6}\s+', text, re.MULTILINE))
+    return len(HEADING_RE.findall(text))
 
 
 def _discover_memory_files(root: Path) -> List[Tuple[Path, str]]:
@@ -176,36 +276,63 @@ def _discover_memory_files(root: Path) -> List[Tuple[Path, str]]:
     for path, scope in project_locations:
         candidates.append((path, scope))
 
-    # Find nested CLAUDE.md files (monorepos)
-    for p in root.rglob("CLAUDE.md"):
-        if p not in [c[0] for c in candidates]:
-            candidates.append((p, "project-nested"))
+    # Find nested memory files (monorepos) in one walk that never enters
+    # excluded directories; the standard locations above are not repeated
+    seen = {path for path, _ in project_locations}
+    nested: List[Tuple[Path, str]] = []
+    nested_local: List[Tuple[Path, str]] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIRS]
+        if "CLAUDE.md" in filenames:
+            p = Path(dirpath, "CLAUDE.md")
+            if p not in seen:
+                nested.append((p, "project-nested"))
+        if "CLAUDE.local.md" in filenames:
+            p = Path(dirpath, "CLAUDE.local.md")
+            if p not in seen:
+                nested_local.append((p, "local-nested"))
+
+    return candidates + nested + nested_local
+
+
+def _rel_path(path: Path, root: Path) -> str:
+    """Path relative to root, or the path itself if it lies outside root."""
+    try:
+        return str(path.relative_to(root))
+    except ValueError:
+        return str(path)
 
-    for p in root.rglob("CLAUDE.local.md"):
-        if p not in [c[0] for c in candidates]:
-            candidates.append((p, "local-nested"))
 
-    return candidates
+def _analyze_memory_file(
+    path: Path,
+    scope: str,
+    root: Path,
+    tracked: Optional[List[str]],
+    commit_dates: Optional[Dict[str, str]] = None,
+) -> MemoryFileReport:
+    """Analyze a single CLAUDE.md file.
 
+    commit_dates, from _git_last_commit_iso_bulk, answers the git freshness
+    lookup; without it git is asked once for this file.
+    """
+    rel = _rel_path(path, root)
 
-def _analyze_memory_file(path: Path, scope: str, root: Path, tracked: Optional[List[str]]) -> MemoryFileReport:
-    """Analyze a single CLAUDE.md file."""
+    # One stat answers both "is it a regular file" and its size
     try:
-        rel = str(path.relative_to(root))
-    except ValueError:
-        rel = str(path)
-
-    report = MemoryFileReport(path=rel, exists=path.exists() and path.is_file(), scope=scope)
+        st = os.stat(path)
+    except OSError:
+        st = None
+    report = MemoryFileReport(path=rel, exists=st is not None and stat.S_ISREG(st.st_mode), scope=scope)
 
     if not report.exists:
         return report
 
     text = _safe_read_text(path)
-    report.bytes = path.stat().st_size
+    report.bytes = st.st_size
     report.lines = text.count("\n") + (1 if text else 0)
     report.word_count = len(text.split())
-    report.has_headings = bool(re.search(r'^#{1,6}\s+', text, re.MULTILINE))
     report.heading_count = _count_headings(text)
+    report.has_headings = report.heading_count > 0
     report.imports = _extract_imports(text)
 
     # Validate imports
@@ -217,7 +344,10 @@ def _analyze_memory_file(path: Path, scope: str, root: Path, tracked: Optional[L
 
     # Git freshness
     if tracked is not None:
-        report.last_git_commit_iso = _git_last_commit_iso(root, rel)
+        if commit_dates is not None:
+            report.last_git_commit_iso = commit_dates.get(rel)
+        else:
+            report.last_git_commit_iso = _git_last_commit_iso(root, rel)
 
     # Analyze issues and recommendations
     if "local" in scope:
@@ -255,7 +385,7 @@ def _analyze_memory_file(path: Path, scope: str, root: Path, tracked: Optional[L
 
 def _discover_settings_files(root: Path) -> List[Tuple[Path, str]]:
     """Discover Claude Code settings.json files."""
-    home = Path.home()
+    home = _home()
     candidates = [
         (home / ".claude" / "settings.json", "user"),
         (root / ".claude" / "settings.json", "project"),
@@ -307,7 +437,7 @@ def _analyze_settings_file(path: Path, scope: str) -> SettingsFileReport:
 
 def _discover_mcp_configs(root: Path) -> List[Tuple[Path, str]]:
     """Discover MCP configuration files."""
-    home = Path.home()
+    home = _home()
     return [
         (home / ".claude" / "mcp.json", "user"),
         (root / ".mcp.json", "project"),
@@ -338,24 +468,26 @@ def _analyze_mcp_config(path: Path, scope: str) -> MCPConfigReport:
     return report
 
 
+def _scandir(path: Path) -> List[os.DirEntry]:
+    """List a directory's entries; a missing or unreadable one has none."""
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
 def _discover_skills(root: Path) -> List[Tuple[Path, str]]:
     """Discover Claude Code skills."""
-    home = Path.home()
+    home = _home()
     skills = []
 
-    # User skills
-    user_skills_dir = home / ".claude" / "skills"
-    if user_skills_dir.exists():
-        for skill_dir in user_skills_dir.iterdir():
-            if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
-                skills.append((skill_dir, "user"))
-
-    # Project skills
-    project_skills_dir = root / ".claude" / "skills"
-    if project_skills_dir.exists():
-        for skill_dir in project_skills_dir.iterdir():
-            if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
-                skills.append((skill_dir, "project"))
+    # DirEntry caches the file type; only SKILL.md itself needs a stat
+    for scope, skills_dir in (("user", home / ".claude" / "skills"),
+                              ("project", root / ".claude" / "skills")):
+        for entry in _scandir(skills_dir):
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "SKILL.md")):
+                skills.append((Path(entry.path), scope))
 
     return skills
 
@@ -396,20 +528,14 @@ def _analyze_skill(skill_dir: Path, scope: str, root: Path) -> SkillReport:
 
 def _discover_subagents(root: Path) -> List[Tuple[Path, str]]:
     """Discover Claude Code subagents."""
-    home = Path.home()
+    home = _home()
     agents = []
 
-    # User agents
-    user_agents_dir = home / ".claude" / "agents"
-    if user_agents_dir.exists():
-        for agent_file in user_agents_dir.glob("*.md"):
-            agents.append((agent_file, "user"))
-
-    # Project agents
-    project_agents_dir = root / ".claude" / "agents"
-    if project_agents_dir.exists():
-        for agent_file in project_agents_dir.glob("*.md"):
-            agents.append((agent_file, "project"))
+    for scope, agents_dir in (("user", home / ".claude" / "agents"),
+                              ("project", root / ".claude" / "agents")):
+        for entry in _scandir(agents_dir):
+            if entry.name.endswith(".md") and entry.is_file():
+                agents.append((Path(entry.path), scope))
 
     return agents
 
@@ -437,74 +563,113 @@ def _analyze_subagent(agent_path: Path, scope: str, root: Path) -> SubagentRepor
     return report
 
 
-def _get_directory_stats(root: Path, tracked: Optional[List[str]]) -> List[Dict[str, Any]]:
+def _count_tracked_by_top_dir(tracked: List[str]) -> Counter:
+    """Count tracked files per top-level directory ("." for files in the root)."""
+    return Counter(f.split("/", 1)[0] if "/" in f else "." for f in tracked)
+
+
+def _count_files_by_top_dir(root: Path) -> Counter:
+    """Count files per top-level directory ("." for files in the root).
+
+    One os.scandir stack walk that never enters EXCLUDE_DIRS or directory
+    symlinks; empty top-level directories are kept with a count of 0.
+    """
+    counts: Counter = Counter()
+    stack = [(str(root), None)]
+    while stack:
+        dirpath, top = stack.pop()
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                # DirEntry caches the file type, so this needs no stat per entry
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDE_DIRS:
+                        if top is None:
+                            counts[entry.name] += 0
+                        stack.append((entry.path, top or entry.name))
+                elif entry.is_file():
+                    counts[top or "."] += 1
+    return counts
+
+
+def _get_directory_stats(top_dirs: Counter) -> List[Dict[str, Any]]:
     """Get top directories by file count."""
-    top_dirs: Dict[str, int] = {}
+    return [{"dir": d, "files": n} for d, n in top_dirs.most_common(20)]
 
-    if tracked is not None:
-        for f in tracked:
-            parts = f.split("/", 1)
-            top = parts[0] if len(parts) > 1 else "."
-            top_dirs[top] = top_dirs.get(top, 0) + 1
-    else:
-        for p in root.iterdir():
-            if p.is_dir() and p.name not in (".git", "node_modules", "dist", "build", ".venv", "__pycache__"):
-                count = sum(1 for _ in p.rglob("*") if _.is_file())
-                top_dirs[p.name] = count
 
-    sorted_dirs = sorted(top_dirs.items(), key=lambda kv: kv[1], reverse=True)[:20]
-    return [{"dir": d, "files": n} for d, n in sorted_dirs]
+def _analyze_all(discover, analyze, root: Path, *args) -> list:
+    """Discover files for one report section and analyze each of them."""
+    return [analyze(p, s, *args) for p, s in discover(root)]
 
 
 def audit(root: Path, include_user_scope: bool = True) -> Dict[str, Any]:
-    """Run full audit on repository."""
+    """Run full audit on repository.
+
+    The sections are independent and bound by disk I/O and git, so the
+    discovery stages run in a thread pool while the repo is being counted.
+    """
     root = root.resolve()
 
-    # Repo scale
-    tracked = _git_tracked_files(root) if _is_git_repo(root) else None
-    if tracked is not None:
-        file_count = len(tracked)
-        file_count_source = "git ls-files"
-    else:
-        file_count = 0
-        exclude_dirs = {"node_modules", ".git", "dist", "build", ".venv", "__pycache__"}
-        for p in root.rglob("*"):
-            if p.is_file() and not any(part in exclude_dirs for part in p.parts):
-                file_count += 1
-        file_count_source = "filesystem walk (excludes node_modules/.git/dist/build/.venv/__pycache__)"
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        memory_future = executor.submit(_discover_memory_files, root)
+        settings_future = executor.submit(_analyze_all, _discover_settings_files, _analyze_settings_file, root)
+        mcp_future = executor.submit(_analyze_all, _discover_mcp_configs, _analyze_mcp_config, root)
+        skills_future = executor.submit(_analyze_all, _discover_skills, _analyze_skill, root, root)
+        subagents_future = executor.submit(_analyze_all, _discover_subagents, _analyze_subagent, root, root)
+
+        # Repo scale
+        tracked = _git_tracked_files(root) if _is_git_repo(root) else None
+        # One enumeration feeds both the total and the per-directory stats
+        if tracked is not None:
+            top_dirs = _count_tracked_by_top_dir(tracked)
+            file_count = len(tracked)
+            file_count_source = "git ls-files"
+        else:
+            top_dirs = _count_files_by_top_dir(root)
+            file_count = sum(top_dirs.values())
+            file_count_source = "filesystem walk (excludes node_modules/.git/dist/build/.venv/__pycache__)"
+
+        memory_files = memory_future.result()
+        settings_reports = settings_future.result()
+        mcp_reports = mcp_future.result()
+        skill_reports = skills_future.result()
+        subagent_reports = subagents_future.result()
 
     large_repo = file_count > 3000
 
     # Memory files
-    memory_files = _discover_memory_files(root)
-    memory_reports = [_analyze_memory_file(p, s, root, tracked) for p, s in memory_files]
+    commit_dates = None
+    if tracked is not None:
+        # Untracked files have no history; leaving them out lets the single
+        # git log stop as soon as every tracked one has been dated
+        tracked_set = set(tracked)
+        tracked_rels = [rel for rel in (_rel_path(p, root) for p, _ in memory_files) if rel in tracked_set]
+        commit_dates = _git_last_commit_iso_bulk(root, tracked_rels)
+        if commit_dates is None:
+            commit_dates = _git_last_commit_iso_each(root, tracked_rels)
+    memory_reports = [_analyze_memory_file(p, s, root, tracked, commit_dates) for p, s in memory_files]
 
     # Settings
-    settings_files = _discover_settings_files(root)
-    settings_reports = [_analyze_settings_file(p, s) for p, s in settings_files]
     if not include_user_scope:
         settings_reports = [r for r in settings_reports if r.scope != "user"]
 
     # MCP configs
-    mcp_configs = _discover_mcp_configs(root)
-    mcp_reports = [_analyze_mcp_config(p, s) for p, s in mcp_configs]
     if not include_user_scope:
         mcp_reports = [r for r in mcp_reports if r.scope != "user"]
 
     # Skills
-    skills = _discover_skills(root)
-    skill_reports = [_analyze_skill(p, s, root) for p, s in skills]
     if not include_user_scope:
         skill_reports = [r for r in skill_reports if r.scope != "user"]
 
     # Subagents
-    subagents = _discover_subagents(root)
-    subagent_reports = [_analyze_subagent(p, s, root) for p, s in subagents]
     if not include_user_scope:
         subagent_reports = [r for r in subagent_reports if r.scope != "user"]
 
     # Directory stats
-    dir_stats = _get_directory_stats(root, tracked)
+    dir_stats = _get_directory_stats(top_dirs)
 
     # Compile recommendations
     all_issues = []
@@ -590,25 +755,25 @@ def audit(root: Path, include_user_scope: bool = True) -> Dict[str, Any]:
             "top_level_dirs_by_file_count": dir_stats,
         },
         "claude_memory": {
-            "discovered_files": [asdict(r) for r in memory_reports if r.exists],
+            "discovered_files": [r.to_dict() for r in memory_reports if r.exists],
             "missing_standard_locations": [
-                asdict(r) for r in memory_reports
+                r.to_dict() for r in memory_reports
                 if not r.exists and r.scope in ("project", "local")
             ],
         },
         "claude_settings": {
-            "discovered_files": [asdict(r) for r in settings_reports if r.exists],
+            "discovered_files": [r.to_dict() for r in settings_reports if r.exists],
         },
         "mcp_configuration": {
-            "discovered_files": [asdict(r) for r in mcp_reports if r.exists],
+            "discovered_files": [r.to_dict() for r in mcp_reports if r.exists],
             "total_servers": sum(r.server_count for r in mcp_reports if r.exists),
         },
         "skills": {
-            "discovered": [asdict(r) for r in skill_reports],
+            "discovered": [r.to_dict() for r in skill_reports],
             "total_count": len(skill_reports),
         },
         "subagents": {
-            "discovered": [asdict(r) for r in subagent_reports],
+            "discovered": [r.to_dict() for r in subagent_reports],
             "total_count": len(subagent_reports),
         },
         "issues": sorted(all_issues, key=lambda x: (x["priority"], x["category"])),
@@ -624,6 +789,8 @@ def main() -> int:
     ap.add_argument("--format", default="json", choices=["json"], help="Output format")
     ap.add_argument("--include-user-scope", action="store_true",
                     help="Include user-scope files (outside project)")
+    ap.add_argument("--compact", action="store_true",
+                    help="Emit single-line JSON instead of indented output")
     args = ap.parse_args()
 
     root = Path(args.root)
@@ -632,7 +799,12 @@ def main() -> int:
         return 1
 
     report = audit(root, include_user_scope=args.include_user_scope)
-    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if args.compact:
+        # One-shot dumps runs on the C encoder, which json.dump never uses
+        sys.stdout.write(json.dumps(report, ensure_ascii=False, separators=(",", ":")) + "\n")
+    else:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
     return 0
 
 
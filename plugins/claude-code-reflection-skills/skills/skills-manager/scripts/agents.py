@@ -4,129 +4,151 @@
 Supports 15 AI coding agents with their skill directory configurations.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TypedDict
 
 
-class AgentConfig(TypedDict):
+@dataclass(frozen=True, slots=True)
+class AgentConfig:
     """Configuration for an AI coding agent."""
     name: str
     display_name: str
     project_dir: str      # Relative path for project-level skills
     global_dir: str       # Path for user-level skills (supports ~)
-    detect_paths: list[str]  # Paths to check for agent installation
+    detect_paths: tuple[str, ...]  # Paths to check for agent installation
+    global_path: Path = field(init=False, repr=False, compare=False)  # Expanded global_dir
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "global_path", Path(self.global_dir).expanduser())
 
 
 # All supported AI coding agents
 AGENTS: dict[str, AgentConfig] = {
-    "opencode": {
-        "name": "opencode",
-        "display_name": "OpenCode",
-        "project_dir": ".opencode/skill",
-        "global_dir": "~/.config/opencode/skill",
-        "detect_paths": ["~/.config/opencode"],
-    },
-    "claude-code": {
-        "name": "claude-code",
-        "display_name": "Claude Code",
-        "project_dir": ".claude/skills",
-        "global_dir": "~/.claude/skills",
-        "detect_paths": ["~/.claude"],
-    },
-    "codex": {
-        "name": "codex",
-        "display_name": "Codex",
-        "project_dir": ".codex/skills",
-        "global_dir": "~/.codex/skills",
-        "detect_paths": ["~/.codex"],
-    },
-    "cursor": {
-        "name": "cursor",
-        "display_name": "Cursor",
-        "project_dir": ".cursor/skills",
-        "global_dir": "~/.cursor/skills",
-        "detect_paths": ["~/.cursor"],
-    },
-    "amp": {
-        "name": "amp",
-        "display_name": "Amp",
-        "project_dir": ".agents/skills",
-        "global_dir": "~/.config/agents/skills",
-        "detect_paths": ["~/.config/amp"],
-    },
-    "kilo": {
-        "name": "kilo",
-        "display_name": "Kilo Code",
-        "project_dir": ".kilocode/skills",
-        "global_dir": "~/.kilocode/skills",
-        "detect_paths": ["~/.kilocode"],
-    },
-    "roo": {
-        "name": "roo",
-        "display_name": "Roo Code",
-        "project_dir": ".roo/skills",
-        "global_dir": "~/.roo/skills",
-        "detect_paths": ["~/.roo"],
-    },
-    "goose": {
-        "name": "goose",
-        "display_name": "Goose",
-        "project_dir": ".goose/skills",
-        "global_dir": "~/.config/goose/skills",
-        "detect_paths": ["~/.config/goose"],
-    },
-    "gemini-cli": {
-        "name": "gemini-cli",
-        "display_name": "Gemini CLI",
-        "project_dir": ".gemini/skills",
-        "global_dir": "~/.gemini/skills",
-        "detect_paths": ["~/.gemini"],
-    },
-    "gemini": {
-        "name": "gemini",
-        "display_name": "Gemini CLI",
-        "project_dir": ".gemini/skills",
-        "global_dir": "~/.gemini/skills",
-        "detect_paths": ["~/.gemini"],
-    },
-    "antigravity": {
-        "name": "antigravity",
-        "display_name": "Antigravity",
-        "project_dir": ".agent/skills",
-        "global_dir": "~/.gemini/antigravity/skills",
-        "detect_paths": ["~/.gemini/antigravity"],
-    },
-    "github-copilot": {
-        "name": "github-copilot",
-        "display_name": "GitHub Copilot",
-        "project_dir": ".github/skills",
-        "global_dir": "~/.copilot/skills",
-        "detect_paths": ["~/.copilot"],
-    },
-    "clawdbot": {
-        "name": "clawdbot",
-        "display_name": "Clawdbot",
-        "project_dir": "skills",
-        "global_dir": "~/.clawdbot/skills",
-        "detect_paths": ["~/.clawdbot"],
-    },
-    "droid": {
-        "name": "droid",
-        "display_name": "Droid",
-        "project_dir": ".factory/skills",
-        "global_dir": "~/.factory/skills",
-        "detect_paths": ["~/.factory/skills"],
-    },
-    "windsurf": {
-        "name": "windsurf",
-        "display_name": "Windsurf",
-        "project_dir": ".windsurf/skills",
-        "global_dir": "~/.codeium/windsurf/skills",
-        "detect_paths": ["~/.codeium/windsurf"],
-    },
+    "opencode": AgentConfig(
+        name="opencode",
+        display_name="OpenCode",
+        project_dir=".opencode/skill",
+        global_dir="~/.config/opencode/skill",
+        detect_paths=("~/.config/opencode",),
+    ),
+    "claude-code": AgentConfig(
+        name="claude-code",
+        display_name="Claude Code",
+        project_dir=".claude/skills",
+        global_dir="~/.claude/skills",
+        detect_paths=("~/.claude",),
+    ),
+    "codex": AgentConfig(
+        name="codex",
+        display_name="Codex",
+        project_dir=".codex/skills",
+        global_dir="~/.codex/skills",
+        detect_paths=("~/.codex",),
+    ),
+    "cursor": AgentConfig(
+        name="cursor",
+        display_name="Cursor",
+        project_dir=".cursor/skills",
+        global_dir="~/.cursor/skills",
+        detect_paths=("~/.cursor",),
+    ),
+    "amp": AgentConfig(
+        name="amp",
+        display_name="Amp",
+        project_dir=".agents/skills",
+        global_dir="~/.config/agents/skills",
+        detect_paths=("~/.config/amp",),
+    ),
+    "kilo": AgentConfig(
+        name="kilo",
+        display_name="Kilo Code",
+        project_dir=".kilocode/skills",
+        global_dir="~/.kilocode/skills",
+        detect_paths=("~/.kilocode",),
+    ),
+    "roo": AgentConfig(
+        name="roo",
+        display_name="Roo Code",
+        project_dir=".roo/skills",
+        global_dir="~/.roo/skills",
+        detect_paths=("~/.roo",),
+    ),
+    "goose": AgentConfig(
+        name="goose",
+        display_name="Goose",
+        project_dir=".goose/skills",
+        global_dir="~/.config/goose/skills",
+        detect_paths=("~/.config/goose",),
+    ),
+    "gemini-cli": AgentConfig(
+        name="gemini-cli",
+        display_name="Gemini CLI",
+        project_dir=".gemini/skills",
+        global_dir="~/.gemini/skills",
+        detect_paths=("~/.gemini",),
+    ),
+    "gemini": AgentConfig(
+        name="gemini",
+        display_name="Gemini CLI",
+        project_dir=".gemini/skills",
+        global_dir="~/.gemini/skills",
+        detect_paths=("~/.gemini",),
+    ),
+    "antigravity": AgentConfig(
+        name="antigravity",
+        display_name="Antigravity",
+        project_dir=".agent/skills",
+        global_dir="~/.gemini/antigravity/skills",
+        detect_paths=("~/.gemini/antigravity",),
+    ),
+    "github-copilot": AgentConfig(
+        name="github-copilot",
+        display_name="GitHub Copilot",
+        project_dir=".github/skills",
+        global_dir="~/.copilot/skills",
+        detect_paths=("~/.copilot",),
+    ),
+    "clawdbot": AgentConfig(
+        name="clawdbot",
+        display_name="Clawdbot",
+        project_dir="skills",
+        global_dir="~/.clawdbot/skills",
+        detect_paths=("~/.clawdbot",),
+    ),
+    "droid": AgentConfig(
+        name="droid",
+        display_name="Droid",
+        project_dir=".factory/skills",
+        global_dir="~/.factory/skills",
+        detect_paths=("~/.factory/skills",),
+    ),
+    "windsurf": AgentConfig(
+        name="windsurf",
+        display_name="Windsurf",
+        project_dir=".windsurf/skills",
+        global_dir="~/.codeium/windsurf/skills",
+        detect_paths=("~/.codeium/windsurf",),
+    ),
 }
 
 
+def _build_detect_index() -> dict[Path, list[str]]:
+    """Map each expanded detection path to the agent IDs that share it.
+
+    Aliased agents (gemini-cli and gemini) point at the same directory, so
+    each distinct path only needs to be checked once.
+    """
+    index: dict[Path, list[str]] = {}
+    for agent_id, config in AGENTS.items():
+        for detect_path in config.detect_paths:
+            index.setdefault(Path(detect_path).expanduser(), []).append(agent_id)
+    return index
+
+
+_DETECT_INDEX = _build_detect_index()
+
+
 def get_agent_config(agent: str) -> AgentConfig | None:
     """Get configuration for an agent by ID.
 
@@ -175,7 +197,7 @@ def get_project_skills_dir(agent: str, cwd: Path | None = None) -> Path | None:
         return None
 
     base = cwd or Path.cwd()
-    return base / config["project_dir"]
+    return base / config.project_dir
 
 
 def get_global_skills_dir(agent: str) -> Path | None:
@@ -187,39 +209,59 @@ def get_global_skills_dir(agent: str) -> Path | None:
     Returns:
         Path to global skills directory, or None if agent not found
     """
-    config = get_agent_config(agent)
+    config = AGENTS.get(agent)
     if not config:
         return None
 
-    return Path(config["global_dir"]).expanduser()
+    return config.global_path
 
 
 def detect_installed_agents() -> list[str]:
     """Detect which AI agents are installed on this system.
 
-    Checks for the existence of agent-specific directories.
+    Checks for the existence of agent-specific directories. The checks run
+    concurrently so slow (e.g. network-mounted) home directories don't
+    serialize one stat per agent.
 
     Returns:
         List of installed agent IDs
     """
-    installed = []
+    paths = list(_DETECT_INDEX)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        exists = list(executor.map(Path.exists, paths))
 
-    for agent_id, config in AGENTS.items():
-        for detect_path in config["detect_paths"]:
-            path = Path(detect_path).expanduser()
-            if path.exists():
-                installed.append(agent_id)
-                break
+    found = {
+        agent_id
+        for path, hit in zip(paths, exists) if hit
+        for agent_id in _DETECT_INDEX[path]
+    }
+    return [agent_id for agent_id in AGENTS if agent_id in found]
+
+
+def resolve_skill_target(
+    agent: str, scope: str, cwd: Path | None = None
+) -> tuple[AgentConfig, Path] | None:
+    """Resolve an agent and scope to its config and skills directory.
 
-    # Remove duplicates while preserving order (gemini-cli and gemini share detection)
-    seen = set()
-    unique = []
-    for agent in installed:
-        if agent not in seen:
-            seen.add(agent)
-            unique.append(agent)
+    Does the agent lookup once, so callers that need both the config (e.g.
+    for display_name) and the directory don't fetch the config twice.
 
-    return unique
+    Args:
+        agent: Agent ID
+        scope: "project" or "global"
+        cwd: Working directory for project scope
+
+    Returns:
+        Tuple of (config, skills_dir), or None if agent or scope is unknown
+    """
+    config = AGENTS.get(agent)
+    if config is None:
+        return None
+    if scope == "project":
+        return config, (cwd or Path.cwd()) / config.project_dir
+    if scope == "global":
+        return config, config.global_path
+    return None
 
 
 def get_skills_dir(agent: str, scope: str, cwd: Path | None = None) -> Path | None:
@@ -233,8 +275,5 @@ def get_skills_dir(agent: str, scope: str, cwd: Path | None = None) -> Path | No
     Returns:
         Path to skills directory, or None if agent not found
     """
-    if scope == "project":
-        return get_project_skills_dir(agent, cwd)
-    elif scope == "global":
-        return get_global_skills_dir(agent)
-    return None
+    resolved = resolve_skill_target(agent, scope, cwd)
+    return resolved[1] if resolved else None
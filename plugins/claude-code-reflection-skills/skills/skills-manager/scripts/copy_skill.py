@@ -1,17 +1,45 @@
 #!/usr/bin/env python3
 """Copy a skill between AI coding agents."""
 
-import argparse
-import shutil
+import os
+import subprocess
 import sys
 from pathlib import Path
 
 from agents import (
     AGENTS,
-    get_agent_config,
+    AgentConfig,
     get_skills_dir,
-    validate_agent,
+    resolve_skill_target,
 )
+from skill_common import replace_dir
+
+
+def _fast_copytree(src: Path, dst: Path) -> None:
+    """Copy a directory tree, using reflinks where the filesystem allows.
+
+    On Linux, GNU cp's --reflink=auto clones file extents on CoW filesystems
+    (btrfs, XFS) and silently falls back to a regular copy elsewhere. Other
+    platforms, or any cp failure, fall back to shutil.copytree.
+
+    The cp flags match shutil.copytree's defaults: -L copies what symlinks
+    point to rather than the links, and permission bits and timestamps are
+    preserved as copy2 does. Unlike copy2, cp does not carry over extended
+    attributes or BSD file flags.
+    """
+    import shutil
+
+    if sys.platform.startswith("linux") and shutil.which("cp"):
+        result = subprocess.run(
+            ["cp", "-R", "-L", "--reflink=auto", "--preserve=mode,timestamps",
+             "--", str(src), str(dst)],
+            capture_output=True,
+        )
+        if result.returncode == 0:
+            return
+        shutil.rmtree(dst, ignore_errors=True)
+
+    shutil.copytree(src, dst)
 
 
 def find_skill_in_agent(
@@ -31,20 +59,23 @@ def find_skill_in_agent(
     Returns:
         Tuple of (skill_path, scope_name) or (None, None) if not found
     """
-    scopes_to_check = []
-    if scope is None or scope == "global":
-        global_dir = get_skills_dir(agent, "global")
-        if global_dir:
-            scopes_to_check.append(("global", global_dir))
-    if scope is None or scope == "project":
-        project_dir = get_skills_dir(agent, "project", cwd)
-        if project_dir:
-            scopes_to_check.append(("project", project_dir))
-
-    for scope_name, skills_dir in scopes_to_check:
-        skill_path = skills_dir / name
-        if skill_path.exists() and (skill_path / "SKILL.md").exists():
-            return skill_path, scope_name
+    def scopes_to_check():
+        # Resolved lazily so a hit in global scope never builds the project path
+        if scope is None or scope == "global":
+            global_dir = get_skills_dir(agent, "global")
+            if global_dir:
+                yield "global", global_dir
+        if scope is None or scope == "project":
+            project_dir = get_skills_dir(agent, "project", cwd)
+            if project_dir:
+                yield "project", project_dir
+
+    for scope_name, skills_dir in scopes_to_check():
+        # Plain strings on the probe path; only a hit is lifted to a Path.
+        # A SKILL.md inside implies the directory exists: one stat, not two
+        skill_path = os.path.join(skills_dir, name)
+        if os.path.isfile(os.path.join(skill_path, "SKILL.md")):
+            return Path(skill_path), scope_name
 
     return None, None
 
@@ -72,6 +103,28 @@ def copy_skill(
     Returns:
         Tuple of (success, message)
     """
+    from_config = AGENTS.get(from_agent)
+    if from_config is None:
+        return False, f"Unknown source agent '{from_agent}'"
+    to_config = AGENTS.get(to_agent)
+    if to_config is None:
+        return False, f"Unknown target agent '{to_agent}'"
+    return _copy_skill(name, from_config, to_config, from_scope, to_scope, force, cwd)
+
+
+def _copy_skill(
+    name: str,
+    from_config: AgentConfig,
+    to_config: AgentConfig,
+    from_scope: str | None,
+    to_scope: str,
+    force: bool,
+    cwd: Path | None
+) -> tuple[bool, str]:
+    """copy_skill() for configs that were already looked up."""
+    from_agent = from_config.name
+    to_agent = to_config.name
+
     # Find source skill
     source_path, found_scope = find_skill_in_agent(name, from_agent, from_scope, cwd)
     if not source_path:
@@ -79,9 +132,10 @@ def copy_skill(
         return False, f"Skill '{name}' not found in {from_agent}{scope_msg}"
 
     # Get target path
-    target_base = get_skills_dir(to_agent, to_scope, cwd)
-    if not target_base:
+    resolved = resolve_skill_target(to_agent, to_scope, cwd)
+    if not resolved:
         return False, f"Could not determine skills directory for {to_agent}"
+    _, target_base = resolved
 
     target_path = target_base / name
 
@@ -90,22 +144,17 @@ def copy_skill(
         return False, f"Source and target are the same path"
 
     # Check if target exists
-    if target_path.exists():
-        if not force:
-            return False, f"Skill '{name}' already exists at {target_path}. Use --force to overwrite."
-        shutil.rmtree(target_path)
+    if target_path.exists() and not force:
+        return False, f"Skill '{name}' already exists at {target_path}. Use --force to overwrite."
 
     # Copy
     try:
         target_base.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(source_path, target_path)
-
-        from_config = get_agent_config(from_agent)
-        to_config = get_agent_config(to_agent)
+        replace_dir(target_path, lambda tmp: _fast_copytree(source_path, tmp))
 
         return True, (
-            f"Copied '{name}': {from_config['display_name']} ({found_scope}) -> "
-            f"{to_config['display_name']} ({to_scope})\n"
+            f"Copied '{name}': {from_config.display_name} ({found_scope}) -> "
+            f"{to_config.display_name} ({to_scope})\n"
             f"  From: {source_path}\n"
             f"  To:   {target_path}"
         )
@@ -114,6 +163,8 @@ def copy_skill(
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Copy a skill between AI coding agents"
     )
@@ -152,24 +203,27 @@ def main():
     args = parser.parse_args()
 
     # Validate agents
-    if not validate_agent(args.from_agent):
+    from_config = AGENTS.get(args.from_agent)
+    if from_config is None:
         print(f"Error: Unknown source agent '{args.from_agent}'")
         print(f"Valid agents: {', '.join(sorted(AGENTS.keys()))}")
         return 1
 
-    if not validate_agent(args.to_agent):
+    to_config = AGENTS.get(args.to_agent)
+    if to_config is None:
         print(f"Error: Unknown target agent '{args.to_agent}'")
         print(f"Valid agents: {', '.join(sorted(AGENTS.keys()))}")
         return 1
 
-    # Copy skill
-    success, message = copy_skill(
+    # Copy skill; main already holds both configs, so skip the second lookup
+    success, message = _copy_skill(
         args.name,
-        args.from_agent,
-        args.to_agent,
+        from_config,
+        to_config,
         args.from_scope,
         args.to_scope,
-        args.force
+        args.force,
+        None
     )
 
     print(message)
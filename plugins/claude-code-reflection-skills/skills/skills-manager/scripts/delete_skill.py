@@ -1,40 +1,28 @@
 #!/usr/bin/env python3
 """Delete a Claude Code skill."""
 
-import argparse
-import shutil
+import os
 import sys
 from pathlib import Path
 
+from skill_common import find_skill
 
-def get_user_skills_dir() -> Path:
-    """Get the user-level skills directory."""
-    return Path.home() / ".claude" / "skills"
 
+def count_files(path: Path) -> int:
+    """Count regular files under a directory without materializing Paths.
 
-def get_project_skills_dir() -> Path:
-    """Get the project-level skills directory (current working directory)."""
-    return Path.cwd() / ".claude" / "skills"
-
-
-def find_skill(name: str, scope: str | None = None) -> tuple[Path | None, str | None]:
-    """Find a skill by name, optionally filtering by scope.
-
-    Returns:
-        Tuple of (skill_path, scope_name) or (None, None) if not found
+    A skill that is just SKILL.md costs a single directory read.
     """
-    scopes_to_check = []
-    if scope is None or scope == "user":
-        scopes_to_check.append(("user", get_user_skills_dir()))
-    if scope is None or scope == "project":
-        scopes_to_check.append(("project", get_project_skills_dir()))
-
-    for scope_name, skills_dir in scopes_to_check:
-        skill_path = skills_dir / name
-        if skill_path.exists() and (skill_path / "SKILL.md").exists():
-            return skill_path, scope_name
-
-    return None, None
+    count = 0
+    stack = [str(path)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    count += 1
+    return count
 
 
 def delete_skill(name: str, scope: str | None = None, force: bool = False) -> bool:
@@ -48,6 +36,8 @@ def delete_skill(name: str, scope: str | None = None, force: bool = False) -> bo
     Returns:
         True if deleted, False otherwise
     """
+    import shutil
+
     skill_path, found_scope = find_skill(name, scope)
 
     if not skill_path:
@@ -62,8 +52,7 @@ def delete_skill(name: str, scope: str | None = None, force: bool = False) -> bo
 
     if not force:
         # List contents
-        files = list(skill_path.rglob("*"))
-        file_count = len([f for f in files if f.is_file()])
+        file_count = count_files(skill_path)
         print(f"Contains {file_count} file(s)")
 
         response = input("\nDelete this skill? [y/N]: ").strip().lower()
@@ -81,6 +70,8 @@ def delete_skill(name: str, scope: str | None = None, force: bool = False) -> bo
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Delete a Claude Code skill")
     parser.add_argument("name", help="Name of the skill to delete")
     parser.add_argument(
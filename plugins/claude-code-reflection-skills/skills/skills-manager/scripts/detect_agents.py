@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 """Detect installed AI coding agents on the system."""
 
-import argparse
-import json
 import sys
-from pathlib import Path
 
 # Import from local agents module
 from agents import AGENTS, detect_installed_agents, get_agent_config
 
+# Output templates, built once instead of per-line f-strings
+_TABLE_HEADER = "NAME | DISPLAY NAME | INSTALLED | GLOBAL DIR\n" + "-" * 80
+_TABLE_ROW_FMT = "{name} | {display_name} | {status} | {global_dir}"
+_ALL_FMT = (
+    "  {display_name} ({name}){flag}\n"
+    "    Project: {project_dir}\n"
+    "    Global:  {global_dir}\n"
+)
+_DETECTED_FMT = "  {display_name} ({name})\n    Global skills: {global_dir}\n"
+
 
 def format_output(agents: list[dict], output_format: str, show_all: bool) -> str:
     """Format agent list for output.
@@ -22,6 +29,7 @@ def format_output(agents: list[dict], output_format: str, show_all: bool) -> str
         Formatted string
     """
     if output_format == "json":
+        import json
         return json.dumps(agents, indent=2)
 
     if not agents:
@@ -30,32 +38,50 @@ def format_output(agents: list[dict], output_format: str, show_all: bool) -> str
         return "No AI coding agents detected."
 
     if output_format == "table":
-        lines = ["NAME | DISPLAY NAME | INSTALLED | GLOBAL DIR", "-" * 80]
-        for a in agents:
-            installed = "Yes" if a.get("installed", True) else "No"
-            lines.append(f"{a['name']} | {a['display_name']} | {installed} | {a['global_dir']}")
-        return "\n".join(lines)
+        rows = (
+            _TABLE_ROW_FMT.format(
+                status="Yes" if a.get("installed", True) else "No", **a
+            )
+            for a in agents
+        )
+        return "\n".join((_TABLE_HEADER, *rows))
 
     # Default text format
     if show_all:
-        lines = ["=== ALL SUPPORTED AGENTS ===", ""]
-        for a in agents:
-            installed = " [INSTALLED]" if a.get("installed") else ""
-            lines.append(f"  {a['display_name']} ({a['name']}){installed}")
-            lines.append(f"    Project: {a['project_dir']}")
-            lines.append(f"    Global:  {a['global_dir']}")
-            lines.append("")
-    else:
-        lines = ["=== DETECTED AI CODING AGENTS ===", ""]
-        for a in agents:
-            lines.append(f"  {a['display_name']} ({a['name']})")
-            lines.append(f"    Global skills: {a['global_dir']}")
-            lines.append("")
+        return "=== ALL SUPPORTED AGENTS ===\n\n" + "\n".join(
+            _ALL_FMT.format(flag=" [INSTALLED]" if a.get("installed") else "", **a)
+            for a in agents
+        )
+    return "=== DETECTED AI CODING AGENTS ===\n\n" + "\n".join(
+        _DETECTED_FMT.format(**a) for a in agents
+    )
+
+
+def write_output(agents: list[dict], output_format: str, show_all: bool, out=None) -> None:
+    """Write formatted agent list to a stream.
+
+    JSON is streamed straight to the stream rather than built as one string
+    first; other formats go through format_output.
+
+    Args:
+        agents: List of agent info dicts
+        output_format: "text", "json", or "table"
+        show_all: Whether showing all agents or just detected
+        out: Text stream to write to (defaults to sys.stdout)
+    """
+    out = out or sys.stdout
+    if output_format == "json":
+        import json
+        json.dump(agents, out, indent=2, ensure_ascii=False)
+        out.write("\n")
+        return
 
-    return "\n".join(lines)
+    out.write(format_output(agents, output_format, show_all) + "\n")
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Detect installed AI coding agents"
     )
@@ -78,10 +104,10 @@ def main():
         agents = []
         for agent_id, config in AGENTS.items():
             agents.append({
-                "name": config["name"],
-                "display_name": config["display_name"],
-                "project_dir": config["project_dir"],
-                "global_dir": config["global_dir"],
+                "name": config.name,
+                "display_name": config.display_name,
+                "project_dir": config.project_dir,
+                "global_dir": config.global_dir,
                 "installed": agent_id in detected,
             })
     else:
@@ -92,13 +118,13 @@ def main():
             config = get_agent_config(agent_id)
             if config:
                 agents.append({
-                    "name": config["name"],
-                    "display_name": config["display_name"],
-                    "project_dir": config["project_dir"],
-                    "global_dir": config["global_dir"],
+                    "name": config.name,
+                    "display_name": config.display_name,
+                    "project_dir": config.project_dir,
+                    "global_dir": config.global_dir,
                 })
 
-    print(format_output(agents, args.format, args.all))
+    write_output(agents, args.format, args.all)
     return 0 if agents else 1
 
 
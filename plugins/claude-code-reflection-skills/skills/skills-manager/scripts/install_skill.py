@@ -2,25 +2,24 @@
 """Install a skill to one or more AI coding agents."""
 
 import argparse
-import re
+import os
 import shutil
+import stat
 import sys
 from pathlib import Path
 
-from agents import (
-    AGENTS,
-    detect_installed_agents,
-    get_agent_config,
-    get_skills_dir,
-    validate_agent,
-)
+from agents import AGENTS, detect_installed_agents, get_skills_dir
+from skill_common import NAME_RE, read_frontmatter, replace_dir
 
 
 # Files to exclude when copying skills (per add-skill pattern)
 EXCLUDE_FILES = {"README.md", "metadata.json"}
 
+# Path separators and null bytes, deleted via str.translate
+_UNSAFE_CHARS = str.maketrans("", "", "/\\:\0")
 
-def parse_skill_name(skill_path: Path) -> str | None:
+
+def parse_skill_name(skill_path: Path) -> str:
     """Parse skill name from SKILL.md frontmatter.
 
     Args:
@@ -28,19 +27,14 @@ def parse_skill_name(skill_path: Path) -> str | None:
 
     Returns:
         Skill name from frontmatter, or directory name as fallback
+        (also when SKILL.md cannot be read)
     """
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        return None
-
     try:
-        content = skill_md.read_text()
-        match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-        if match:
-            frontmatter = match.group(1)
-            for line in frontmatter.split("\n"):
-                if line.startswith("name:"):
-                    return line.split(":", 1)[1].strip().strip('"\'')
+        frontmatter = read_frontmatter(skill_path / "SKILL.md")
+        if frontmatter is not None:
+            match = NAME_RE.search(frontmatter)
+            if match:
+                return match.group(1).strip().strip('"\'')
     except Exception:
         pass
 
@@ -57,7 +51,7 @@ def sanitize_name(name: str) -> str:
         Sanitized name safe for use in paths
     """
     # Remove path separators and null bytes
-    sanitized = re.sub(r'[/\\:\0]', '', name)
+    sanitized = name.translate(_UNSAFE_CHARS)
     # Remove leading/trailing dots and spaces
     sanitized = sanitized.strip('. ')
     # Remove leading dots (prevent ..)
@@ -82,25 +76,9 @@ def is_excluded(name: str) -> bool:
     return False
 
 
-def copy_skill_directory(src: Path, dest: Path) -> None:
-    """Copy a skill directory, excluding certain files.
-
-    Args:
-        src: Source directory
-        dest: Destination directory
-    """
-    dest.mkdir(parents=True, exist_ok=True)
-
-    for item in src.iterdir():
-        if is_excluded(item.name):
-            continue
-
-        dest_path = dest / item.name
-
-        if item.is_dir():
-            copy_skill_directory(item, dest_path)
-        else:
-            shutil.copy2(item, dest_path)
+def ignore_excluded(dirpath: str, names: list[str]) -> list[str]:
+    """shutil.copytree ignore callback that skips excluded files."""
+    return [name for name in names if is_excluded(name)]
 
 
 def install_skill(
@@ -122,15 +100,16 @@ def install_skill(
     Returns:
         Tuple of (success, message)
     """
-    # Validate source
-    if not source.exists():
+    # Validate source: one stat per path covers both existence and type
+    try:
+        source_mode = os.stat(source).st_mode
+    except OSError:
         return False, f"Source path does not exist: {source}"
 
-    if not source.is_dir():
+    if not stat.S_ISDIR(source_mode):
         return False, f"Source is not a directory: {source}"
 
-    skill_md = source / "SKILL.md"
-    if not skill_md.exists():
+    if not os.path.exists(os.path.join(source, "SKILL.md")):
         return False, f"Source does not contain SKILL.md: {source}"
 
     # Get skill name
@@ -147,14 +126,18 @@ def install_skill(
     target_path = target_base / skill_name
 
     # Check if target exists
-    if target_path.exists():
-        if not force:
-            return False, f"Skill '{skill_name}' already exists at {target_path}. Use --force to overwrite."
-        shutil.rmtree(target_path)
+    if target_path.exists() and not force:
+        return False, f"Skill '{skill_name}' already exists at {target_path}. Use --force to overwrite."
 
-    # Copy skill
+    # Copy skill into a sibling and swap it in, so a failed copy never
+    # destroys an existing install
     try:
-        copy_skill_directory(source, target_path)
+        target_base.mkdir(parents=True, exist_ok=True)
+        # shutil.copy keeps permission bits (scripts stay executable) but
+        # skips copy2's per-file timestamp copy
+        replace_dir(target_path, lambda tmp: shutil.copytree(
+            source, tmp, ignore=ignore_excluded, copy_function=shutil.copy
+        ))
         return True, f"Installed '{skill_name}' to {agent} ({scope}): {target_path}"
     except Exception as e:
         return False, f"Error installing skill: {e}"
@@ -199,30 +182,31 @@ def main():
     if args.agents and args.all:
         parser.error("Cannot use both --agent and --all")
 
-    # Determine target agents
+    # Determine target agents, resolving each config once
     if args.all:
-        target_agents = detect_installed_agents()
-        if not target_agents:
+        # Detected agents are always known, so no validation is needed
+        targets = [AGENTS[agent] for agent in detect_installed_agents()]
+        if not targets:
             print("Error: No AI coding agents detected on this system.")
             return 1
     else:
-        target_agents = []
+        targets = []
         for agent in args.agents:
-            if not validate_agent(agent):
+            config = AGENTS.get(agent)
+            if config is None:
                 print(f"Error: Unknown agent '{agent}'")
                 print(f"Valid agents: {', '.join(sorted(AGENTS.keys()))}")
                 return 1
-            target_agents.append(agent)
+            targets.append(config)
 
     # Resolve source path
     source = Path(args.path).resolve()
 
     # Install to each agent
     results = []
-    for agent in target_agents:
-        config = get_agent_config(agent)
-        success, message = install_skill(source, agent, args.scope, args.force)
-        results.append((agent, config["display_name"], success, message))
+    for config in targets:
+        success, message = install_skill(source, config.name, args.scope, args.force)
+        results.append((config.name, config.display_name, success, message))
 
     # Print results
     print(f"\n=== INSTALL RESULTS ===\n")
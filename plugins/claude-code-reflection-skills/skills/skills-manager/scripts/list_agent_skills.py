@@ -2,10 +2,16 @@
 """List skills for any AI coding agent."""
 
 import argparse
+import io
 import json
-import re
+import os
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
+from typing import NamedTuple, TextIO
 
 from agents import (
     AGENTS,
@@ -14,54 +20,52 @@ from agents import (
     get_skills_dir,
     validate_agent,
 )
+from skill_common import parse_skill_metadata
 
 
-def parse_skill_metadata(skill_path: Path) -> dict | None:
-    """Parse SKILL.md frontmatter to extract name and description."""
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        return None
+class Skill(NamedTuple):
+    """A skill found in an agent's skills directory.
 
-    try:
-        content = skill_md.read_text()
-        # Parse YAML frontmatter between --- markers
-        match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-        if not match:
-            return {"name": skill_path.name, "description": "(no frontmatter)"}
-
-        frontmatter = match.group(1)
-        metadata = {"name": skill_path.name, "description": ""}
-
-        for line in frontmatter.split("\n"):
-            if line.startswith("name:"):
-                metadata["name"] = line.split(":", 1)[1].strip().strip('"\'')
-            elif line.startswith("description:"):
-                metadata["description"] = line.split(":", 1)[1].strip().strip('"\'')
-
-        return metadata
-    except Exception as e:
-        return {"name": skill_path.name, "description": f"(error reading: {e})"}
+    skills_dir only feeds the text output's scope headers; to_json() leaves
+    it out so JSON rows keep their original keys.
+    """
+    name: str
+    directory: str
+    scope: str
+    agent: str
+    agent_display_name: str
+    path: str
+    skills_dir: str
+    description: str
+
+    def to_json(self) -> dict:
+        """The skill as a JSON row."""
+        row = self._asdict()
+        del row["skills_dir"]
+        return row
 
 
 def list_skills_for_agent(
     agent: str,
     scope: str | None = None,
-    cwd: Path | None = None
-) -> list[dict]:
+    cwd: Path | None = None,
+    include_metadata: bool = True
+) -> Iterator[Skill]:
     """List skills for a specific agent.
 
     Args:
         agent: Agent ID
         scope: "project", "global", or None for both
         cwd: Working directory for project scope
+        include_metadata: Read SKILL.md frontmatter; if False, name is the
+            directory name and description is empty
 
-    Returns:
-        List of skill info dicts
+    Yields:
+        Skills, as each skills directory is scanned
     """
-    skills = []
     config = get_agent_config(agent)
     if not config:
-        return skills
+        return
 
     scopes_to_check = []
     if scope is None or scope == "global":
@@ -77,94 +81,155 @@ def list_skills_for_agent(
         if not skills_dir.exists():
             continue
 
-        for item in sorted(skills_dir.iterdir()):
-            if item.is_dir() and (item / "SKILL.md").exists():
-                metadata = parse_skill_metadata(item)
+        with os.scandir(skills_dir) as it:
+            entries = sorted(it, key=attrgetter("name"))
+
+        for entry in entries:
+            # DirEntry caches the file type; parse_skill_metadata returns
+            # None when there is no SKILL.md, so that needs no separate stat
+            if entry.is_dir():
+                if include_metadata:
+                    metadata = parse_skill_metadata(entry.path)
+                elif os.path.isfile(os.path.join(entry.path, "SKILL.md")):
+                    metadata = {"name": entry.name, "description": ""}
+                else:
+                    metadata = None
                 if metadata:
-                    skills.append({
-                        "name": metadata["name"],
-                        "directory": item.name,
-                        "scope": scope_name,
-                        "agent": agent,
-                        "agent_display_name": config["display_name"],
-                        "path": str(item),
-                        "description": metadata["description"],
-                    })
-
-    return skills
-
-
-def list_skills_all_agents(scope: str | None = None, cwd: Path | None = None) -> list[dict]:
+                    yield Skill(
+                        name=metadata["name"],
+                        directory=entry.name,
+                        scope=scope_name,
+                        agent=agent,
+                        agent_display_name=config.display_name,
+                        path=entry.path,
+                        skills_dir=str(skills_dir),
+                        description=metadata["description"],
+                    )
+
+
+def list_skills_all_agents(
+    scope: str | None = None,
+    cwd: Path | None = None,
+    include_metadata: bool = True
+) -> Iterator[Skill]:
     """List skills for all detected agents.
 
+    Agents are scanned concurrently, so this does not stream row by row:
+    each agent's skills are yielded together once its scan, and the scans
+    of every agent detected before it, have finished.
+
     Args:
         scope: "project", "global", or None for both
         cwd: Working directory for project scope
+        include_metadata: Read SKILL.md frontmatter (see list_skills_for_agent)
 
-    Returns:
-        List of skill info dicts grouped by agent
+    Yields:
+        Skills grouped by agent, in detection order
     """
-    all_skills = []
     detected = detect_installed_agents()
+    if not detected:
+        return
 
-    for agent in detected:
-        skills = list_skills_for_agent(agent, scope, cwd)
-        all_skills.extend(skills)
+    def scan(agent: str) -> list[Skill]:
+        return list(list_skills_for_agent(agent, scope, cwd, include_metadata))
 
-    return all_skills
+    with ThreadPoolExecutor(max_workers=min(8, len(detected))) as executor:
+        for skills in executor.map(scan, detected):
+            yield from skills
 
 
-def format_output(skills: list[dict], output_format: str, single_agent: bool = False) -> str:
-    """Format skills list for output."""
-    if output_format == "json":
-        return json.dumps(skills, indent=2)
+def format_output(
+    skills: Iterable[Skill],
+    output_format: str,
+    single_agent: bool = False
+) -> str:
+    """Format skills for output as a single string (see write_output)."""
+    out = io.StringIO()
+    write_output(skills, output_format, single_agent, out)
+    return out.getvalue().removesuffix("\n")
+
 
-    if not skills:
-        return "No skills found."
+def write_output(
+    skills: Iterable[Skill],
+    output_format: str,
+    single_agent: bool = False,
+    out: TextIO | None = None
+) -> int:
+    """Write skills to a stream, row by row as they are produced.
 
+    Text and table rows are written as the skills iterable yields them;
+    JSON has to collect the full list before serializing.
+
+    Args:
+        skills: Skills to write
+        output_format: "text", "json", or "table"
+        single_agent: Omit agent grouping/columns
+        out: Text stream to write to (defaults to sys.stdout)
+
+    Returns:
+        Number of skills written
+    """
+    out = out or sys.stdout
+
+    if output_format == "json":
+        rows = [s.to_json() for s in skills]
+        json.dump(rows, out, indent=2)
+        out.write("\n")
+        return len(rows)
+
+    skills = iter(skills)
+    first = next(skills, None)
+    if first is None:
+        out.write("No skills found.\n")
+        return 0
+
+    count = 0
     if output_format == "table":
         # Simple table format
         if single_agent:
-            lines = ["NAME | SCOPE | DESCRIPTION", "-" * 70]
+            out.write("NAME | SCOPE | DESCRIPTION\n" + "-" * 70 + "\n")
         else:
-            lines = ["AGENT | NAME | SCOPE | DESCRIPTION", "-" * 90]
+            out.write("AGENT | NAME | SCOPE | DESCRIPTION\n" + "-" * 90 + "\n")
 
-        for s in skills:
-            desc = s["description"][:35] + "..." if len(s["description"]) > 35 else s["description"]
+        for s in chain((first,), skills):
+            count += 1
+            desc = s.description
+            if len(desc) > 35:
+                desc = desc[:35] + "..."
             if single_agent:
-                lines.append(f"{s['name']} | {s['scope']} | {desc}")
+                out.write(f"{s.name} | {s.scope} | {desc}\n")
             else:
-                lines.append(f"{s['agent']} | {s['name']} | {s['scope']} | {desc}")
-        return "\n".join(lines)
+                out.write(f"{s.agent} | {s.name} | {s.scope} | {desc}\n")
+        return count
 
     # Default text format
-    lines = []
     current_agent = None
     current_scope = None
 
-    for s in skills:
+    for s in chain((first,), skills):
+        count += 1
+        agent, scope, desc = s.agent, s.scope, s.description
+
         # Group by agent first (if showing multiple agents)
-        if not single_agent and s["agent"] != current_agent:
+        if not single_agent and agent != current_agent:
             if current_agent is not None:
-                lines.append("")
-            lines.append(f"=== {s['agent_display_name'].upper()} ({s['agent']}) ===")
-            current_agent = s["agent"]
+                out.write("\n")
+            out.write(f"=== {s.agent_display_name.upper()} ({agent}) ===\n")
+            current_agent = agent
             current_scope = None
 
         # Then group by scope
-        if s["scope"] != current_scope:
-            skills_dir = get_skills_dir(s["agent"], s["scope"])
-            lines.append(f"\n  [{s['scope'].upper()}] {skills_dir}")
-            current_scope = s["scope"]
-
-        lines.append(f"\n    {s['name']}")
-        if s["description"]:
-            desc = s["description"]
-            lines.append(f"      {desc[:80]}")
+        if scope != current_scope:
+            out.write(f"\n  [{scope.upper()}] {s.skills_dir}\n")
+            current_scope = scope
+
+        out.write(f"\n    {s.name}\n")
+        if desc:
+            out.write(f"      {desc[:80]}\n")
             if len(desc) > 80:
-                lines.append(f"      {desc[80:160]}")
+                out.write(f"      {desc[80:160]}\n")
 
-    return "\n".join(lines)
+    return count
 
 
 def main():
@@ -191,6 +256,11 @@ def main():
         default="text",
         help="Output format (default: text)"
     )
+    parser.add_argument(
+        "--no-metadata",
+        action="store_true",
+        help="Skip reading SKILL.md frontmatter (list directory names only)"
+    )
     args = parser.parse_args()
 
     # Validate arguments
@@ -207,14 +277,14 @@ def main():
 
     # List skills
     if args.all:
-        skills = list_skills_all_agents(args.scope)
+        skills = list_skills_all_agents(args.scope, include_metadata=not args.no_metadata)
         single_agent = False
     else:
-        skills = list_skills_for_agent(args.agent, args.scope)
+        skills = list_skills_for_agent(args.agent, args.scope, include_metadata=not args.no_metadata)
         single_agent = True
 
-    print(format_output(skills, args.format, single_agent))
-    return 0 if skills else 1
+    count = write_output(skills, args.format, single_agent)
+    return 0 if count else 1
 
 
 if __name__ == "__main__":
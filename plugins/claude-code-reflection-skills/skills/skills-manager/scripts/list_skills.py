@@ -2,56 +2,27 @@
 """List all Claude Code skills from user and project scopes."""
 
 import argparse
+import io
 import json
 import os
-import re
 import sys
-from pathlib import Path
+from operator import attrgetter
 
+from skill_common import get_project_skills_dir, get_user_skills_dir, parse_skill_metadata
 
-def get_user_skills_dir() -> Path:
-    """Get the user-level skills directory."""
-    return Path.home() / ".claude" / "skills"
 
-
-def get_project_skills_dir() -> Path:
-    """Get the project-level skills directory (current working directory)."""
-    return Path.cwd() / ".claude" / "skills"
-
-
-def parse_skill_metadata(skill_path: Path) -> dict | None:
-    """Parse SKILL.md frontmatter to extract name and description."""
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        return None
-
-    try:
-        content = skill_md.read_text()
-        # Parse YAML frontmatter between --- markers
-        match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-        if not match:
-            return {"name": skill_path.name, "description": "(no frontmatter)"}
-
-        frontmatter = match.group(1)
-        metadata = {"name": skill_path.name, "description": ""}
-
-        for line in frontmatter.split("\n"):
-            if line.startswith("name:"):
-                metadata["name"] = line.split(":", 1)[1].strip().strip('"\'')
-            elif line.startswith("description:"):
-                metadata["description"] = line.split(":", 1)[1].strip().strip('"\'')
-
-        return metadata
-    except Exception as e:
-        return {"name": skill_path.name, "description": f"(error reading: {e})"}
-
-
-def list_skills(scope: str | None = None, output_format: str = "text") -> list[dict]:
+def list_skills(
+    scope: str | None = None,
+    output_format: str = "text",
+    include_metadata: bool = True
+) -> list[dict]:
     """List skills from specified scope(s).
 
     Args:
         scope: "user", "project", or None for both
         output_format: "text", "json", or "table"
+        include_metadata: Read SKILL.md frontmatter; if False, name is the
+            directory name and description is empty
 
     Returns:
         List of skill info dicts
@@ -68,15 +39,25 @@ def list_skills(scope: str | None = None, output_format: str = "text") -> list[d
         if not skills_dir.exists():
             continue
 
-        for item in sorted(skills_dir.iterdir()):
-            if item.is_dir() and (item / "SKILL.md").exists():
-                metadata = parse_skill_metadata(item)
+        with os.scandir(skills_dir) as it:
+            entries = sorted(it, key=attrgetter("name"))
+
+        for entry in entries:
+            # DirEntry caches the file type; parse_skill_metadata returns
+            # None when there is no SKILL.md, so that needs no separate stat
+            if entry.is_dir():
+                if include_metadata:
+                    metadata = parse_skill_metadata(entry.path)
+                elif os.path.isfile(os.path.join(entry.path, "SKILL.md")):
+                    metadata = {"name": entry.name, "description": ""}
+                else:
+                    metadata = None
                 if metadata:
                     skills.append({
                         "name": metadata["name"],
-                        "directory": item.name,
+                        "directory": entry.name,
                         "scope": scope_name,
-                        "path": str(item),
+                        "path": entry.path,
                         "description": metadata["description"],
                     })
 
@@ -84,40 +65,46 @@ def list_skills(scope: str | None = None, output_format: str = "text") -> list[d
 
 
 def format_output(skills: list[dict], output_format: str) -> str:
-    """Format skills list for output."""
+    """Format skills list for output.
+
+    Lines are written to a buffer as they are built; the last line's
+    newline is dropped, so callers terminate the output themselves.
+    """
     if output_format == "json":
         return json.dumps(skills, indent=2)
 
     if not skills:
         return "No skills found."
 
+    buf = io.StringIO()
+    write = buf.write
+
     if output_format == "table":
         # Simple table format
-        lines = ["NAME | SCOPE | DESCRIPTION", "-" * 60]
+        write("NAME | SCOPE | DESCRIPTION\n" + "-" * 60 + "\n")
         for s in skills:
             desc = s["description"][:40] + "..." if len(s["description"]) > 40 else s["description"]
-            lines.append(f"{s['name']} | {s['scope']} | {desc}")
-        return "\n".join(lines)
+            write(f"{s['name']} | {s['scope']} | {desc}\n")
+        return buf.getvalue().removesuffix("\n")
 
     # Default text format
-    lines = []
     current_scope = None
     for s in skills:
         if s["scope"] != current_scope:
             if current_scope is not None:
-                lines.append("")
-            lines.append(f"=== {s['scope'].upper()} SKILLS ({get_user_skills_dir() if s['scope'] == 'user' else get_project_skills_dir()}) ===")
+                write("\n")
+            write(f"=== {s['scope'].upper()} SKILLS ({get_user_skills_dir() if s['scope'] == 'user' else get_project_skills_dir()}) ===\n")
             current_scope = s["scope"]
 
-        lines.append(f"\n  {s['name']}")
+        write(f"\n  {s['name']}\n")
         if s["description"]:
             # Wrap description
             desc = s["description"]
-            lines.append(f"    {desc[:80]}")
+            write(f"    {desc[:80]}\n")
             if len(desc) > 80:
-                lines.append(f"    {desc[80:160]}")
+                write(f"    {desc[80:160]}\n")
 
-    return "\n".join(lines)
+    return buf.getvalue().removesuffix("\n")
 
 
 def main():
@@ -133,9 +120,14 @@ def main():
         default="text",
         help="Output format (default: text)"
     )
+    parser.add_argument(
+        "--no-metadata",
+        action="store_true",
+        help="Skip reading SKILL.md frontmatter (list directory names only)"
+    )
     args = parser.parse_args()
 
-    skills = list_skills(args.scope, args.format)
+    skills = list_skills(args.scope, args.format, not args.no_metadata)
     print(format_output(skills, args.format))
 
     return 0 if skills else 1
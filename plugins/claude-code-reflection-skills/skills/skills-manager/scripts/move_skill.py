@@ -4,30 +4,8 @@
 import argparse
 import shutil
 import sys
-from pathlib import Path
 
-
-def get_user_skills_dir() -> Path:
-    """Get the user-level skills directory."""
-    return Path.home() / ".claude" / "skills"
-
-
-def get_project_skills_dir() -> Path:
-    """Get the project-level skills directory (current working directory)."""
-    return Path.cwd() / ".claude" / "skills"
-
-
-def find_skill(name: str) -> tuple[Path | None, str | None]:
-    """Find a skill by name in either scope.
-
-    Returns:
-        Tuple of (skill_path, scope_name) or (None, None) if not found
-    """
-    for scope_name, skills_dir in [("user", get_user_skills_dir()), ("project", get_project_skills_dir())]:
-        skill_path = skills_dir / name
-        if skill_path.exists() and (skill_path / "SKILL.md").exists():
-            return skill_path, scope_name
-    return None, None
+from skill_common import find_skill, get_project_skills_dir, get_user_skills_dir
 
 
 def move_skill(name: str, to_scope: str, force: bool = False) -> bool:
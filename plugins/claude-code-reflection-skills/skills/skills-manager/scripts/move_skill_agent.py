@@ -105,8 +105,8 @@ def move_skill(
         to_config = get_agent_config(to_agent)
 
         return True, (
-            f"Moved '{name}': {from_config['display_name']} ({found_scope}) -> "
-            f"{to_config['display_name']} ({to_scope})\n"
+            f"Moved '{name}': {from_config.display_name} ({found_scope}) -> "
+            f"{to_config.display_name} ({to_scope})\n"
             f"  From: {source_path} (removed)\n"
             f"  To:   {target_path}"
         )
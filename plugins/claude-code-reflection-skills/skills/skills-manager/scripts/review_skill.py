@@ -4,68 +4,138 @@
 import argparse
 import json
 import re
+import stat
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-
-def get_user_skills_dir() -> Path:
-    return Path.home() / ".claude" / "skills"
-
-
-def get_project_skills_dir() -> Path:
-    return Path.cwd() / ".claude" / "skills"
-
-
-def find_skill(name: str, scope: str | None = None) -> tuple[Path | None, str | None]:
-    """Find a skill by name, optionally filtering by scope."""
-    scopes_to_check = []
-    if scope is None or scope == "user":
-        scopes_to_check.append(("user", get_user_skills_dir()))
-    if scope is None or scope == "project":
-        scopes_to_check.append(("project", get_project_skills_dir()))
-
-    for scope_name, skills_dir in scopes_to_check:
-        skill_path = skills_dir / name
-        if skill_path.exists() and (skill_path / "SKILL.md").exists():
-            return skill_path, scope_name
-    return None, None
+from skill_common import load_skill
+
+RESERVED_WORD_RE = re.compile(r"anthropic|claude", re.IGNORECASE)
+NAME_FORMAT_RE = re.compile(r"^[a-z][a-z0-9-]*$")
+GERUND_RE = re.compile(r"^[a-z]+-?[a-z]*ing(-[a-z]+)*$|^[a-z]*ing-[a-z]+(-[a-z]+)*$")
+# Each rule family is one alternation, so a single scan covers every pattern;
+# named groups, numbered in priority order, map a hit back to its label.
+# IGNORECASE spares lowercasing a copy of the text before every scan
+TRIGGER_RE = re.compile(
+    r"\b(?:use when|use for|triggers? on|when (?:the )?user|when asked)\b", re.IGNORECASE
+)
+PERSON_RE = re.compile(
+    r"\b(?:(?P<p0>I can)|(?P<p1>I will)|(?P<p2>I help)|(?P<p3>you can)|(?P<p4>you will)|(?P<p5>we can))\b",
+    re.IGNORECASE,
+)
+PERSON_LABELS = {
+    "p0": "I can",
+    "p1": "I will",
+    "p2": "I help",
+    "p3": "you can",
+    "p4": "you will",
+    "p5": "we can",
+}
+VAGUE_RE = re.compile(
+    r"^(?:helps with \w+$|processes data$|does stuff|utility for|helper for)", re.IGNORECASE
+)
+TIME_RE = re.compile(
+    r"\b(?:"
+    r"(?P<t0>(?:before|after) (?:january|february|march|april|may|june|july|august|september|october|november|december) \d{4})"
+    r"|(?P<t1>(?:before|after) \d{4})"
+    r"|(?P<t2>as of \d{4})"
+    r"|(?P<t3>starting (?:in )?\d{4})"
+    r"|(?P<t4>until \d{4})"
+    r")\b",
+    re.IGNORECASE,
+)
+TIME_LABELS = {
+    "t0": "date reference",
+    "t1": "year reference",
+    "t2": "as of year",
+    "t3": "starting year",
+    "t4": "until year",
+}
+TOC_RE = re.compile(r"## contents|## table of contents|- \[.*\]\(#", re.IGNORECASE)
+WINDOWS_PATH_RE = re.compile(r"[a-zA-Z]:\\|\\\\")
+MD_LINK_RE = re.compile(r"\[.*?\]\(([^)]+\.md)\)")
+
+SEVERITY_ICONS = {"error": "❌", "warning": "⚠️", "info": "ℹ️"}
+RULE = "=" * 60
+
+
+def first_label(pattern: re.Pattern, labels: dict[str, str], text: str) -> str | None:
+    """Label of the highest-priority alternative of pattern found in text.
+
+    Priority is the order of labels, not the position in text, so a later
+    hit on an earlier-listed alternative still wins. The scan stops early
+    once the top alternative is seen.
+    """
+    order = list(labels)
+    best = None
+    for m in pattern.finditer(text):
+        if best is None or order.index(m.lastgroup) < order.index(best):
+            best = m.lastgroup
+            if best == order[0]:
+                break
+    return labels[best] if best else None
 
 
-def parse_frontmatter(content: str) -> tuple[dict, str]:
-    """Parse YAML frontmatter and return (metadata, body)."""
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)$", content, re.DOTALL)
-    if not match:
-        return {}, content
+def count_lines(text: str) -> int:
+    """Count lines as len(text.split("\\n")) would, without building the list."""
+    return text.count("\n") + 1
 
-    frontmatter = match.group(1)
-    body = match.group(2)
-    metadata = {}
 
-    for line in frontmatter.split("\n"):
-        if ":" in line:
-            key, value = line.split(":", 1)
-            metadata[key.strip()] = value.strip().strip('"\'')
+@lru_cache(maxsize=256)
+def _scan_md_file(md_file: str, mtime_ns: int, size: int) -> tuple[bool, bool]:
+    """Scan a markdown file; mtime_ns and size only serve as cache keys."""
+    content = Path(md_file).read_text()
+    has_refs = MD_LINK_RE.search(content) is not None
+    # The TOC scan can cover the whole file, so only pay for it once the
+    # line count says a TOC is expected
+    missing_toc = count_lines(content) > 100 and TOC_RE.search(content) is None
+    return has_refs, missing_toc
 
-    return metadata, body
 
+def scan_md_file(md_file: Path) -> tuple[bool, bool] | None:
+    """Read a reference file once for every check that needs it.
 
-def check_name(name: str) -> list[dict]:
-    """Check name against best practices."""
-    issues = []
+    Results are cached per (path, mtime, size), so a file linked from
+    SKILL.md and then visited again by the structure check is only read
+    and decoded once.
 
-    # Reserved words
-    reserved = ["anthropic", "claude"]
-    for word in reserved:
-        if word in name.lower():
-            issues.append({
-                "severity": "warning",
-                "rule": "reserved-word",
-                "message": f"Name contains reserved word '{word}'",
-                "suggestion": f"Consider renaming without '{word}' (e.g., 'skills-manager' instead of 'claude-skills-manager')"
-            })
+    Returns:
+        Tuple of (has_md_links, missing_toc), or None if md_file is not a
+        regular file; missing_toc means over 100 lines without a TOC
+    """
+    try:
+        st = md_file.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return _scan_md_file(str(md_file), st.st_mtime_ns, st.st_size)
+
+
+def scan_md_files(md_files: list[Path]) -> list[tuple[bool, bool] | None]:
+    """Scan several reference files concurrently, preserving input order."""
+    if len(md_files) < 2:
+        return [scan_md_file(f) for f in md_files]
+    with ThreadPoolExecutor(max_workers=min(8, len(md_files))) as executor:
+        return list(executor.map(scan_md_file, md_files))
+
+
+def check_name(name: str, issues: list[dict]) -> None:
+    """Check name against best practices, appending to issues."""
+    # Reserved words (one scan; each word reported once)
+    for word in dict.fromkeys(m.lower() for m in RESERVED_WORD_RE.findall(name)):
+        issues.append({
+            "severity": "warning",
+            "rule": "reserved-word",
+            "message": f"Name contains reserved word '{word}'",
+            "suggestion": f"Consider renaming without '{word}' (e.g., 'skills-manager' instead of 'claude-skills-manager')"
+        })
 
     # Naming convention (gerund form preferred)
-    if not re.match(r"^[a-z][a-z0-9-]*$", name):
+    if not NAME_FORMAT_RE.match(name):
         issues.append({
             "severity": "error",
             "rule": "name-format",
@@ -82,8 +152,7 @@ def check_name(name: str) -> list[dict]:
         })
 
     # Check for gerund form (recommended but not required)
-    gerund_pattern = r"^[a-z]+-?[a-z]*ing(-[a-z]+)*$|^[a-z]*ing-[a-z]+(-[a-z]+)*$"
-    if not re.match(gerund_pattern, name):
+    if not GERUND_RE.match(name):
         issues.append({
             "severity": "info",
             "rule": "gerund-form",
@@ -91,13 +160,9 @@ def check_name(name: str) -> list[dict]:
             "suggestion": f"Consider renaming to gerund form (e.g., 'managing-skills' instead of '{name}')"
         })
 
-    return issues
-
-
-def check_description(description: str) -> list[dict]:
-    """Check description against best practices."""
-    issues = []
 
+def check_description(description: str, issues: list[dict]) -> None:
+    """Check description against best practices, appending to issues."""
     if not description:
         issues.append({
             "severity": "error",
@@ -105,7 +170,7 @@ def check_description(description: str) -> list[dict]:
             "message": "Description is empty",
             "suggestion": "Add a description that explains what the skill does and when to use it"
         })
-        return issues
+        return
 
     if len(description) > 1024:
         issues.append({
@@ -116,15 +181,7 @@ def check_description(description: str) -> list[dict]:
         })
 
     # Check for trigger words
-    trigger_patterns = [
-        r"\buse when\b",
-        r"\buse for\b",
-        r"\btrigger[s]? on\b",
-        r"\bwhen (the )?user\b",
-        r"\bwhen asked\b",
-    ]
-    has_trigger = any(re.search(p, description.lower()) for p in trigger_patterns)
-    if not has_trigger:
+    if not TRIGGER_RE.search(description):
         issues.append({
             "severity": "warning",
             "rule": "missing-triggers",
@@ -133,50 +190,28 @@ def check_description(description: str) -> list[dict]:
         })
 
     # Check for first/second person (should be third person)
-    first_second_person = [
-        (r"\bI can\b", "I can"),
-        (r"\bI will\b", "I will"),
-        (r"\bI help\b", "I help"),
-        (r"\byou can\b", "you can"),
-        (r"\byou will\b", "you will"),
-        (r"\bwe can\b", "we can"),
-    ]
-    for pattern, phrase in first_second_person:
-        if re.search(pattern, description, re.IGNORECASE):
-            issues.append({
-                "severity": "warning",
-                "rule": "third-person",
-                "message": f"Description uses '{phrase}' instead of third person",
-                "suggestion": "Rewrite in third person (e.g., 'Processes files...' not 'I process files...')"
-            })
-            break
+    person = first_label(PERSON_RE, PERSON_LABELS, description)
+    if person:
+        issues.append({
+            "severity": "warning",
+            "rule": "third-person",
+            "message": f"Description uses '{person}' instead of third person",
+            "suggestion": "Rewrite in third person (e.g., 'Processes files...' not 'I process files...')"
+        })
 
     # Check for vague descriptions
-    vague_patterns = [
-        (r"^helps with \w+$", "Too vague"),
-        (r"^processes data$", "Too vague"),
-        (r"^does stuff", "Too vague"),
-        (r"^utility for", "Too vague"),
-        (r"^helper for", "Too vague"),
-    ]
-    for pattern, reason in vague_patterns:
-        if re.search(pattern, description.lower()):
-            issues.append({
-                "severity": "warning",
-                "rule": "vague-description",
-                "message": f"Description is too vague: {reason}",
-                "suggestion": "Be specific about what the skill does and include key terms"
-            })
-            break
-
-    return issues
+    if VAGUE_RE.search(description):
+        issues.append({
+            "severity": "warning",
+            "rule": "vague-description",
+            "message": "Description is too vague: Too vague",
+            "suggestion": "Be specific about what the skill does and include key terms"
+        })
 
 
-def check_body(body: str, skill_path: Path) -> list[dict]:
-    """Check SKILL.md body against best practices."""
-    issues = []
-    lines = body.split("\n")
-    line_count = len(lines)
+def check_body(body: str, skill_path: Path, issues: list[dict]) -> None:
+    """Check SKILL.md body against best practices, appending to issues."""
+    line_count = count_lines(body)
 
     # Line count check
     if line_count > 500:
@@ -188,26 +223,17 @@ def check_body(body: str, skill_path: Path) -> list[dict]:
         })
 
     # Check for time-sensitive information
-    time_patterns = [
-        (r"\b(before|after) (january|february|march|april|may|june|july|august|september|october|november|december) \d{4}\b", "date reference"),
-        (r"\b(before|after) \d{4}\b", "year reference"),
-        (r"\bas of \d{4}\b", "as of year"),
-        (r"\bstarting (in )?\d{4}\b", "starting year"),
-        (r"\buntil \d{4}\b", "until year"),
-    ]
-    for pattern, desc in time_patterns:
-        matches = re.findall(pattern, body.lower())
-        if matches:
-            issues.append({
-                "severity": "warning",
-                "rule": "time-sensitive",
-                "message": f"Body contains time-sensitive information ({desc})",
-                "suggestion": "Move time-sensitive info to 'Old patterns' section or remove"
-            })
-            break
+    time_label = first_label(TIME_RE, TIME_LABELS, body)
+    if time_label:
+        issues.append({
+            "severity": "warning",
+            "rule": "time-sensitive",
+            "message": f"Body contains time-sensitive information ({time_label})",
+            "suggestion": "Move time-sensitive info to 'Old patterns' section or remove"
+        })
 
     # Check for Windows-style paths
-    if re.search(r"[a-zA-Z]:\\|\\\\", body):
+    if WINDOWS_PATH_RE.search(body):
         issues.append({
             "severity": "warning",
             "rule": "windows-paths",
@@ -216,13 +242,13 @@ def check_body(body: str, skill_path: Path) -> list[dict]:
         })
 
     # Check for deeply nested references (more than one level)
-    ref_files = re.findall(r"\[.*?\]\(([^)]+\.md)\)", body)
-    for ref_file in ref_files:
-        ref_path = skill_path / ref_file
-        if ref_path.exists():
-            ref_content = ref_path.read_text()
-            nested_refs = re.findall(r"\[.*?\]\(([^)]+\.md)\)", ref_content)
-            if nested_refs:
+    # A file linked several times is scanned and reported once
+    ref_files = list(dict.fromkeys(MD_LINK_RE.findall(body)))
+    scans = scan_md_files([skill_path / ref_file for ref_file in ref_files])
+    for ref_file, scan in zip(ref_files, scans):
+        if scan:
+            has_refs, _ = scan
+            if has_refs:
                 issues.append({
                     "severity": "info",
                     "rule": "nested-references",
@@ -232,9 +258,7 @@ def check_body(body: str, skill_path: Path) -> list[dict]:
 
     # Check for table of contents in long files
     if line_count > 100:
-        toc_patterns = [r"## contents", r"## table of contents", r"- \[.*\]\(#"]
-        has_toc = any(re.search(p, body.lower()) for p in toc_patterns)
-        if not has_toc:
+        if not TOC_RE.search(body):
             issues.append({
                 "severity": "info",
                 "rule": "missing-toc",
@@ -242,65 +266,55 @@ def check_body(body: str, skill_path: Path) -> list[dict]:
                 "suggestion": "Add a table of contents to help Claude navigate the content"
             })
 
-    return issues
-
-
-def check_structure(skill_path: Path) -> list[dict]:
-    """Check skill directory structure."""
-    issues = []
 
+def check_structure(skill_path: Path, issues: list[dict]) -> None:
+    """Check skill directory structure, appending to issues."""
     # Check for reference files longer than 100 lines without TOC
-    for md_file in skill_path.glob("**/*.md"):
-        if md_file.name == "SKILL.md":
+    md_files = [f for f in skill_path.rglob("*.md") if f.name != "SKILL.md"]
+    for md_file, scan in zip(md_files, scan_md_files(md_files)):
+        if not scan:
             continue
-        content = md_file.read_text()
-        lines = content.split("\n")
-        if len(lines) > 100:
-            toc_patterns = [r"## contents", r"## table of contents", r"- \[.*\]\(#"]
-            has_toc = any(re.search(p, content.lower()) for p in toc_patterns)
-            if not has_toc:
-                rel_path = md_file.relative_to(skill_path)
-                issues.append({
-                    "severity": "info",
-                    "rule": "reference-toc",
-                    "message": f"Reference file '{rel_path}' exceeds 100 lines without TOC",
-                    "suggestion": "Add table of contents to help Claude navigate"
-                })
-
-    return issues
+        _, missing_toc = scan
+        if missing_toc:
+            rel_path = md_file.relative_to(skill_path)
+            issues.append({
+                "severity": "info",
+                "rule": "reference-toc",
+                "message": f"Reference file '{rel_path}' exceeds 100 lines without TOC",
+                "suggestion": "Add table of contents to help Claude navigate"
+            })
 
 
-def review_skill(name: str, scope: str | None = None, output_format: str = "text") -> dict:
+def review_skill(name: str, scope: str | None = None) -> dict:
     """Review a skill against best practices.
 
     Returns:
         Dict with skill info and issues found
     """
-    skill_path, found_scope = find_skill(name, scope)
+    loaded = load_skill(name, scope)
 
-    if not skill_path:
+    if not loaded:
         return {
             "error": f"Skill '{name}' not found",
             "found": False
         }
 
-    skill_md = skill_path / "SKILL.md"
-    content = skill_md.read_text()
-    metadata, body = parse_frontmatter(content)
+    metadata, body, skill_path, found_scope = loaded
 
     skill_name = metadata.get("name", skill_path.name)
     description = metadata.get("description", "")
 
     all_issues = []
-    all_issues.extend(check_name(skill_name))
-    all_issues.extend(check_description(description))
-    all_issues.extend(check_body(body, skill_path))
-    all_issues.extend(check_structure(skill_path))
+    check_name(skill_name, all_issues)
+    check_description(description, all_issues)
+    check_body(body, skill_path, all_issues)
+    check_structure(skill_path, all_issues)
 
     # Count by severity
-    error_count = len([i for i in all_issues if i["severity"] == "error"])
-    warning_count = len([i for i in all_issues if i["severity"] == "warning"])
-    info_count = len([i for i in all_issues if i["severity"] == "info"])
+    counts = Counter(i["severity"] for i in all_issues)
+    error_count = counts["error"]
+    warning_count = counts["warning"]
+    info_count = counts["info"]
 
     # Calculate score (simple scoring)
     max_score = 100
@@ -313,7 +327,7 @@ def review_skill(name: str, scope: str | None = None, output_format: str = "text
         "scope": found_scope,
         "path": str(skill_path),
         "description": description,
-        "body_lines": len(body.split("\n")),
+        "body_lines": count_lines(body),
         "issues": all_issues,
         "summary": {
             "errors": error_count,
@@ -333,9 +347,9 @@ def format_output(result: dict, output_format: str) -> str:
         return f"Error: {result.get('error', 'Unknown error')}"
 
     lines = [
-        f"{'=' * 60}",
+        RULE,
         f"Skill Review: {result['name']}",
-        f"{'=' * 60}",
+        RULE,
         f"Scope: {result['scope']}",
         f"Path:  {result['path']}",
         f"Lines: {result['body_lines']}",
@@ -352,12 +366,14 @@ def format_output(result: dict, output_format: str) -> str:
         lines.append("-" * 40)
 
         for issue in result["issues"]:
-            severity = issue["severity"].upper()
-            icon = {"error": "❌", "warning": "⚠️", "info": "ℹ️"}.get(issue["severity"], "•")
-            lines.append(f"")
-            lines.append(f"{icon} [{severity}] {issue['rule']}")
-            lines.append(f"   {issue['message']}")
-            lines.append(f"   → {issue['suggestion']}")
+            severity = issue["severity"]
+            icon = SEVERITY_ICONS.get(severity, "•")
+            lines.extend((
+                "",
+                f"{icon} [{severity.upper()}] {issue['rule']}",
+                f"   {issue['message']}",
+                f"   → {issue['suggestion']}",
+            ))
     else:
         lines.append("")
         lines.append("✅ No issues found! Skill follows best practices.")
@@ -383,7 +399,7 @@ def main():
     )
     args = parser.parse_args()
 
-    result = review_skill(args.name, args.scope, args.format)
+    result = review_skill(args.name, args.scope)
     print(format_output(result, args.format))
 
     if not result.get("found"):
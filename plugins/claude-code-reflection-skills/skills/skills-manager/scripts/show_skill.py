@@ -4,109 +4,70 @@
 import argparse
 import json
 import os
-import re
 import sys
+from collections.abc import Iterator
+from operator import itemgetter
 from pathlib import Path
 
+from skill_common import find_skill, read_skill_md
 
-def get_user_skills_dir() -> Path:
-    """Get the user-level skills directory."""
-    return Path.home() / ".claude" / "skills"
 
+def walk_entries(root: Path) -> Iterator[os.DirEntry]:
+    """Yield every entry below root, depth-first, without following symlinks.
 
-def get_project_skills_dir() -> Path:
-    """Get the project-level skills directory (current working directory)."""
-    return Path.cwd() / ".claude" / "skills"
-
-
-def find_skill(name: str, scope: str | None = None) -> tuple[Path | None, str | None]:
-    """Find a skill by name, optionally filtering by scope.
-
-    Returns:
-        Tuple of (skill_path, scope_name) or (None, None) if not found
+    DirEntry caches the file type from the directory read and stats at most
+    once, so callers get is_file()/stat() without extra syscalls per check.
     """
-    scopes_to_check = []
-    if scope is None or scope == "user":
-        scopes_to_check.append(("user", get_user_skills_dir()))
-    if scope is None or scope == "project":
-        scopes_to_check.append(("project", get_project_skills_dir()))
-
-    for scope_name, skills_dir in scopes_to_check:
-        skill_path = skills_dir / name
-        if skill_path.exists() and (skill_path / "SKILL.md").exists():
-            return skill_path, scope_name
-
-    return None, None
-
-
-def parse_frontmatter(content: str) -> dict:
-    """Parse YAML frontmatter from SKILL.md content."""
-    match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        return {}
-
-    frontmatter = match.group(1)
-    metadata = {}
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                yield entry
 
-    current_key = None
-    current_value = []
 
-    for line in frontmatter.split("\n"):
-        # Check for new key
-        key_match = re.match(r"^(\w[\w-]*):\s*(.*)", line)
-        if key_match:
-            # Save previous key if exists
-            if current_key:
-                value = "\n".join(current_value).strip()
-                metadata[current_key] = value.strip('"\'')
+def get_skill_info(skill_path: Path, scope: str, include_files: bool = True) -> dict:
+    """Get comprehensive information about a skill.
 
-            current_key = key_match.group(1)
-            current_value = [key_match.group(2)]
-        elif current_key and line.startswith("  "):
-            # Continuation of multi-line value
-            current_value.append(line.strip())
-
-    # Save last key
-    if current_key:
-        value = "\n".join(current_value).strip()
-        metadata[current_key] = value.strip('"\'')
-
-    return metadata
-
-
-def get_skill_info(skill_path: Path, scope: str) -> dict:
-    """Get comprehensive information about a skill."""
-    skill_md = skill_path / "SKILL.md"
-    content = skill_md.read_text()
-
-    # Parse frontmatter
-    metadata = parse_frontmatter(content)
-
-    # Get body (everything after frontmatter)
-    body_match = re.match(r"^---\s*\n.*?\n---\s*\n(.*)$", content, re.DOTALL)
-    body = body_match.group(1).strip() if body_match else content
+    Args:
+        skill_path: Skill directory
+        scope: Scope the skill was found in
+        include_files: Build the per-file listing; if False, "files" is
+            empty and only file_count/total_size are computed
+    """
+    metadata, body = read_skill_md(skill_path)
+    body = body.strip()
 
-    # Count body lines/words
-    body_lines = len(body.split("\n"))
+    # Count body lines/words (count() avoids building a list of lines)
+    body_lines = body.count("\n") + 1
     body_words = len(body.split())
 
     # Get directory structure
     files = []
-    dirs = set()
+    dirs = []
+    file_count = 0
     total_size = 0
 
-    for item in skill_path.rglob("*"):
-        rel_path = item.relative_to(skill_path)
-        if item.is_file():
-            size = item.stat().st_size
+    prefix_len = len(os.fspath(skill_path)) + 1
+    for entry in walk_entries(skill_path):
+        rel_path = entry.path[prefix_len:]
+        if entry.is_file():
+            size = entry.stat().st_size
+            file_count += 1
             total_size += size
-            files.append({
-                "path": str(rel_path),
-                "size": size,
-                "type": item.suffix or "(no extension)"
-            })
-        elif item.is_dir():
-            dirs.add(str(rel_path))
+            if include_files:
+                files.append({
+                    "path": rel_path,
+                    "size": size,
+                    "type": os.path.splitext(entry.name)[1] or "(no extension)"
+                })
+        elif entry.is_dir():
+            dirs.append(rel_path)
+
+    # Each directory is visited once, so no set is needed; sorting makes
+    # the JSON output stable across runs and filesystems
+    dirs.sort()
 
     # Check for standard directories
     has_scripts = (skill_path / "scripts").exists()
@@ -122,10 +83,10 @@ def get_skill_info(skill_path: Path, scope: str) -> dict:
         "metadata": metadata,
         "body_lines": body_lines,
         "body_words": body_words,
-        "file_count": len(files),
+        "file_count": file_count,
         "total_size": total_size,
         "files": files,
-        "directories": list(dirs),
+        "directories": dirs,
         "has_scripts": has_scripts,
         "has_references": has_references,
         "has_assets": has_assets,
@@ -164,7 +125,9 @@ def show_skill(name: str, scope: str | None = None, output_format: str = "text",
         return False
 
     try:
-        info = get_skill_info(skill_path, found_scope)
+        info = get_skill_info(
+            skill_path, found_scope, include_files=show_files or output_format == "json"
+        )
     except Exception as e:
         print(f"Error reading skill: {e}")
         return False
@@ -209,7 +172,8 @@ def show_skill(name: str, scope: str | None = None, output_format: str = "text",
     if show_files and info['files']:
         print(f"")
         print(f"Files:")
-        for f in sorted(info['files'], key=lambda x: x['path']):
+        info['files'].sort(key=itemgetter('path'))
+        for f in info['files']:
             print(f"  {f['path']} ({format_size(f['size'])})")
 
     return True
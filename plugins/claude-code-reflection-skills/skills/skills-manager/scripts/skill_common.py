@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Shared skill lookup, SKILL.md parsing and directory helpers."""
+
+import os
+import re
+import shutil
+import stat
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+
+# Frontmatter block, plus the body when a line break follows the closing ---
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---(?:\s*\n(.*))?", re.DOTALL)
+# "key: value" line opening a frontmatter entry
+FM_KEY_RE = re.compile(r"(\w[\w-]*):\s*(.*)")
+# name:/description: lines within a frontmatter block
+NAME_RE = re.compile(r"^name:(.*)$", re.MULTILINE)
+DESCRIPTION_RE = re.compile(r"^description:(.*)$", re.MULTILINE)
+
+# Frontmatter sits at the top of SKILL.md; this much covers it in practice
+FRONTMATTER_READ_SIZE = 4096
+
+
+@lru_cache(maxsize=1)
+def get_user_skills_dir() -> Path:
+    """Get the user-level skills directory."""
+    return Path.home() / ".claude" / "skills"
+
+
+@lru_cache(maxsize=1)
+def get_project_skills_dir() -> Path:
+    """Get the project-level skills directory (current working directory)."""
+    return Path.cwd() / ".claude" / "skills"
+
+
+def find_skill(name: str, scope: str | None = None) -> tuple[Path | None, str | None]:
+    """Find a skill by name, optionally filtering by scope.
+
+    Returns:
+        Tuple of (skill_path, scope_name) or (None, None) if not found
+    """
+    scopes_to_check = []
+    if scope is None or scope == "user":
+        scopes_to_check.append(("user", get_user_skills_dir()))
+    if scope is None or scope == "project":
+        scopes_to_check.append(("project", get_project_skills_dir()))
+
+    for scope_name, skills_dir in scopes_to_check:
+        # A SKILL.md inside implies the directory exists: one stat, not two
+        skill_path = os.path.join(skills_dir, name)
+        if os.path.isfile(os.path.join(skill_path, "SKILL.md")):
+            return Path(skill_path), scope_name
+
+    return None, None
+
+
+def parse_frontmatter(content: str) -> tuple[dict, str]:
+    """Parse YAML frontmatter from SKILL.md content.
+
+    Indented lines continue the previous key's value, so multi-line
+    descriptions are kept whole.
+
+    Returns:
+        Tuple of (metadata, body); body is the whole content when there is
+        no frontmatter or nothing follows it
+    """
+    match = FRONTMATTER_RE.match(content)
+    if not match:
+        return {}, content
+
+    frontmatter = match.group(1)
+    metadata = {}
+
+    current_key = None
+    current_value = []
+
+    for line in frontmatter.splitlines():
+        # Check for new key
+        key_match = FM_KEY_RE.match(line)
+        if key_match:
+            # Save previous key if exists
+            if current_key:
+                value = "\n".join(current_value).strip()
+                metadata[current_key] = value.strip('"\'')
+
+            current_key = key_match.group(1)
+            current_value = [key_match.group(2)]
+        elif current_key and line.startswith("  "):
+            # Continuation of multi-line value
+            current_value.append(line.strip())
+
+    # Save last key
+    if current_key:
+        value = "\n".join(current_value).strip()
+        metadata[current_key] = value.strip('"\'')
+
+    body = match.group(2)
+    return metadata, body if body is not None else content
+
+
+@lru_cache(maxsize=256)
+def _read_skill_md(skill_md: str, mtime_ns: int, size: int) -> tuple[dict, str]:
+    """Read and parse a SKILL.md; mtime_ns and size only serve as cache keys."""
+    return parse_frontmatter(Path(skill_md).read_text())
+
+
+def read_skill_md(skill_path: Path) -> tuple[dict, str]:
+    """Read and parse a skill's SKILL.md.
+
+    Results are cached per (path, mtime, size), so a caller that both
+    reviews and shows a skill in one process reads and parses it once.
+
+    Returns:
+        Tuple of (metadata, body) as returned by parse_frontmatter
+    """
+    skill_md = os.path.join(skill_path, "SKILL.md")
+    st = os.stat(skill_md)
+    metadata, body = _read_skill_md(skill_md, st.st_mtime_ns, st.st_size)
+    return dict(metadata), body
+
+
+def load_skill(name: str, scope: str | None = None) -> tuple[dict, str, Path, str] | None:
+    """Find a skill and parse its SKILL.md.
+
+    Returns:
+        Tuple of (metadata, body, skill_path, scope_name) or None if not found
+    """
+    skill_path, scope_name = find_skill(name, scope)
+    if not skill_path:
+        return None
+    metadata, body = read_skill_md(skill_path)
+    return metadata, body, skill_path, scope_name
+
+
+def read_frontmatter(skill_md: str | Path) -> str | None:
+    """Read the YAML frontmatter block of a SKILL.md file.
+
+    Only the first few KiB are read and decoded; the rest of the file is
+    read only if the closing --- marker isn't within that prefix.
+
+    Args:
+        skill_md: Path to SKILL.md
+
+    Returns:
+        Frontmatter text (without the --- markers), or None if there is none
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(skill_md, "rb") as f:
+        head = f.read(FRONTMATTER_READ_SIZE)
+        match = FRONTMATTER_RE.match(head.decode("utf-8", errors="replace"))
+        if not match and len(head) == FRONTMATTER_READ_SIZE:
+            head += f.read()
+            match = FRONTMATTER_RE.match(head.decode("utf-8", errors="replace"))
+    return match.group(1) if match else None
+
+
+def parse_skill_metadata(skill_path: str | Path) -> dict | None:
+    """Parse SKILL.md frontmatter to extract name and description.
+
+    Results are cached per (path, mtime, size), so a SKILL.md reached more
+    than once in a process (e.g. agents sharing a skills directory) is only
+    read once, and an edited file is always re-read.
+    """
+    skill_md = os.path.join(skill_path, "SKILL.md")
+    try:
+        st = os.stat(skill_md)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    metadata = _parse_skill_md(
+        skill_md, os.path.basename(skill_path), st.st_mtime_ns, st.st_size
+    )
+    return dict(metadata)
+
+
+@lru_cache(maxsize=2048)
+def _parse_skill_md(skill_md: str, dir_name: str, mtime_ns: int, size: int) -> dict:
+    """Parse a SKILL.md; mtime_ns and size only serve as cache keys."""
+    try:
+        frontmatter = read_frontmatter(skill_md)
+        if frontmatter is None:
+            return {"name": dir_name, "description": "(no frontmatter)"}
+
+        metadata = {"name": dir_name, "description": ""}
+
+        match = NAME_RE.search(frontmatter)
+        if match:
+            metadata["name"] = match.group(1).strip().strip('"\'')
+        match = DESCRIPTION_RE.search(frontmatter)
+        if match:
+            metadata["description"] = match.group(1).strip().strip('"\'')
+
+        return metadata
+    except Exception as e:
+        return {"name": dir_name, "description": f"(error reading: {e})"}
+
+
+def replace_dir(dst: Path, populate: Callable[[Path], None]) -> None:
+    """Build a directory beside dst, then swap it into place.
+
+    populate() fills a hidden sibling path, so a failed copy leaves an
+    existing dst untouched. The old tree is renamed aside, the new one renamed
+    into place, and the old one removed last.
+
+    Args:
+        dst: Directory to create or replace
+        populate: Called with the temporary path; must create it
+    """
+    tmp_path = dst.with_name(f".{dst.name}.tmp.{os.getpid()}")
+    trash_path = dst.with_name(f".{dst.name}.trash.{os.getpid()}")
+
+    try:
+        populate(tmp_path)
+    except Exception:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    had_existing = dst.exists()
+    if had_existing:
+        os.replace(dst, trash_path)
+    try:
+        os.replace(tmp_path, dst)
+    except Exception:
+        if had_existing:
+            os.replace(trash_path, dst)
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    if had_existing:
+        shutil.rmtree(trash_path, ignore_errors=True)
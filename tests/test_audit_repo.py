@@ -0,0 +1,113 @@
+"""Tests for optimizing-claude-code/scripts/audit_repo.py."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "plugins/claude-code-reflection-skills/skills/optimizing-claude-code/scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import audit_repo  # noqa: E402
+
+
+@unittest.skipUnless(shutil.which("git"), "needs git")
+class GitLastCommitBulkTest(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+        self.day = 0
+        self.git("init", "-q", "-b", "main")
+        self.git("config", "user.name", "Test")
+        self.git("config", "user.email", "test@example.com")
+        self.git("config", "commit.gpgsign", "false")
+
+    def git(self, *args: str) -> str:
+        # Each commit gets its own fixed date, one day after the last
+        env = dict(os.environ)
+        date = f"2024-01-{self.day + 1:02d}T12:00:00+00:00"
+        env.update(GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+        return subprocess.run(["git", *args], cwd=self.root, env=env, check=True,
+                              capture_output=True, text=True).stdout
+
+    def commit(self, message: str, files: dict[str, str]):
+        for rel, content in files.items():
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+            self.git("add", "--", rel)
+        self.git("commit", "-q", "-m", message)
+        self.day += 1
+
+    def merge(self, branch: str, resolve: dict[str, str] = None):
+        if resolve is None:
+            self.git("merge", "-q", "--no-ff", "-m", f"Merge {branch}", branch)
+        else:
+            subprocess.run(["git", "merge", "-q", "--no-ff", branch], cwd=self.root,
+                           capture_output=True)
+            self.commit(f"Merge {branch}", resolve)
+            return
+        self.day += 1
+
+    def assert_matches_each(self):
+        rels = audit_repo._git_tracked_files(self.root)
+        expected = {rel: audit_repo._git_last_commit_iso(self.root, rel) for rel in rels}
+        self.assertEqual(audit_repo._git_last_commit_iso_bulk(self.root, rels), expected)
+        # Any subset gives the same dates as the whole set
+        for rel in rels:
+            self.assertEqual(audit_repo._git_last_commit_iso_bulk(self.root, [rel]),
+                             {rel: expected[rel]})
+        return expected
+
+    def test_renames_and_odd_names(self):
+        self.commit("init", {
+            "CLAUDE.md": "a\n",
+            "docs/old name.md": "old\n",
+            "docs/ünïcödé.md": "u\n",
+            "space dir/x y.md": "x\n",
+            "*.md": "glob-looking name\n",
+        })
+        self.git("mv", "docs/old name.md", "docs/new name.md")
+        self.commit("rename", {})
+        self.commit("edit", {"docs/ünïcödé.md": "u2\n"})
+        self.commit("other", {"CLAUDE.md": "b\n"})
+
+        dates = self.assert_matches_each()
+        self.assertEqual(dates["docs/new name.md"], "2024-01-02T12:00:00+00:00")
+        self.assertEqual(dates["*.md"], "2024-01-01T12:00:00+00:00")
+        self.assertEqual(dates["docs/ünïcödé.md"], "2024-01-03T12:00:00+00:00")
+
+    def test_merges(self):
+        self.commit("init", {"a.md": "a\n", "b.md": "b\n", "c.md": "c\n", "d.md": "d\n"})
+        self.git("checkout", "-q", "-b", "topic")
+        self.commit("topic a", {"a.md": "a topic\n"})
+        self.commit("topic c", {"c.md": "c topic\n"})
+        self.git("checkout", "-q", "main")
+        self.commit("main b", {"b.md": "b main\n"})
+        self.commit("main c", {"c.md": "c main\n"})
+        # c.md conflicts; the merge commit itself is its newest change
+        self.merge("topic", resolve={"c.md": "c merged\n"})
+        self.git("checkout", "-q", "-b", "topic2")
+        self.commit("topic2 d", {"d.md": "d topic2\n"})
+        self.git("checkout", "-q", "main")
+        self.commit("main a", {"a.md": "a main\n"})
+        self.merge("topic2")
+
+        dates = self.assert_matches_each()
+        self.assertEqual(dates["c.md"], "2024-01-06T12:00:00+00:00")
+        self.assertEqual(dates["d.md"], "2024-01-07T12:00:00+00:00")
+
+    def test_untracked_path_left_out(self):
+        self.commit("init", {"a.md": "a\n"})
+        self.assertEqual(audit_repo._git_last_commit_iso_bulk(self.root, ["a.md", "nope.md"]),
+                         {"a.md": "2024-01-01T12:00:00+00:00"})
+
+    def test_empty(self):
+        self.assertEqual(audit_repo._git_last_commit_iso_bulk(self.root, []), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""Tests for skills-manager/scripts/copy_skill.py."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "plugins/claude-code-reflection-skills/skills/skills-manager/scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import copy_skill  # noqa: E402
+
+
+def snapshot(root: Path) -> dict:
+    """Map each relative path below root to (kind, content, mode, mtime_ns)."""
+    result = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            st = os.lstat(path)
+            if os.path.islink(path):
+                kind, content = "link", os.readlink(path)
+            elif os.path.isdir(path):
+                kind, content = "dir", None
+            else:
+                kind, content = "file", Path(path).read_bytes()
+            result[os.path.relpath(path, root)] = (kind, content, st.st_mode, st.st_mtime_ns)
+    return result
+
+
+class FastCopytreeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+        src = self.tmp / "src"
+        (src / "scripts").mkdir(parents=True)
+        (src / "SKILL.md").write_text("---\nname: demo\n---\n")
+        (src / "scripts" / "run.py").write_text("print('hi')\n")
+        os.chmod(src / "scripts" / "run.py", 0o751)
+
+        shared = self.tmp / "shared"
+        (shared / "refs").mkdir(parents=True)
+        (shared / "note.md").write_text("shared note\n")
+        (shared / "refs" / "a.md").write_text("a\n")
+        os.symlink(shared / "note.md", src / "note.md")
+        os.symlink(shared / "refs", src / "refs")
+
+        old = 1_600_000_000_000_000_000
+        for dirpath, dirnames, filenames in os.walk(self.tmp):
+            for name in dirnames + filenames:
+                os.utime(os.path.join(dirpath, name), ns=(old, old), follow_symlinks=False)
+        os.utime(src, ns=(old, old))
+        self.src = src
+
+    @unittest.skipUnless(sys.platform.startswith("linux") and shutil.which("cp"), "needs GNU cp")
+    def test_matches_shutil_copytree(self):
+        expected_dst = self.tmp / "expected"
+        actual_dst = self.tmp / "actual"
+        shutil.copytree(self.src, expected_dst)
+        copy_skill._fast_copytree(self.src, actual_dst)
+
+        actual = snapshot(actual_dst)
+        self.assertEqual(actual, snapshot(expected_dst))
+        # Symlinks were followed, not recreated
+        self.assertEqual(actual["note.md"][0], "file")
+        self.assertEqual(actual["refs"][0], "dir")
+        self.assertEqual(actual["refs/a.md"][1], b"a\n")
+
+
+class CopySkillTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.cwd)
+        skill = self.cwd / ".claude" / "skills" / "demo"
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text("---\nname: demo\n---\n")
+
+    def test_takes_agent_ids(self):
+        ok, message = copy_skill.copy_skill("demo", "claude-code", "cursor", cwd=self.cwd)
+        self.assertTrue(ok, message)
+        self.assertTrue((self.cwd / ".cursor" / "skills" / "demo" / "SKILL.md").is_file())
+
+    def test_unknown_agent(self):
+        ok, message = copy_skill.copy_skill("demo", "claude-code", "no-such-agent", cwd=self.cwd)
+        self.assertFalse(ok)
+        self.assertIn("no-such-agent", message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Tests for skills-manager/scripts/detect_agents.py."""
+
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "plugins/claude-code-reflection-skills/skills/skills-manager/scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import detect_agents  # noqa: E402
+
+AGENTS = [
+    {"name": "claude-code", "display_name": "Claude Code", "project_dir": ".claude/skills",
+     "global_dir": "~/.claude/skills", "installed": True},
+    {"name": "cursor", "display_name": "Cursor", "project_dir": ".cursor/skills",
+     "global_dir": "~/.cursor/skills", "installed": False},
+]
+
+
+class FormatOutputTest(unittest.TestCase):
+    def test_json(self):
+        self.assertEqual(detect_agents.format_output(AGENTS, "json", True),
+                         json.dumps(AGENTS, indent=2))
+        self.assertEqual(detect_agents.format_output([], "json", False), "[]")
+
+    def test_write_output_matches_format_output(self):
+        for output_format in ("text", "json", "table"):
+            for agents in (AGENTS, []):
+                with self.subTest(output_format=output_format, agents=len(agents)):
+                    out = io.StringIO()
+                    detect_agents.write_output(agents, output_format, True, out)
+                    self.assertEqual(out.getvalue(),
+                                     detect_agents.format_output(agents, output_format, True) + "\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Tests for skills-manager/scripts/list_agent_skills.py."""
+
+import io
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "plugins/claude-code-reflection-skills/skills/skills-manager/scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import list_agent_skills  # noqa: E402
+
+
+class JsonOutputTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.cwd)
+        skills_dir = self.cwd / ".claude" / "skills"
+        for name, description in (("beta", "Second skill"), ("alpha", "First skill")):
+            (skills_dir / name).mkdir(parents=True)
+            (skills_dir / name / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: {description}\n---\n\nBody\n"
+            )
+        (skills_dir / "not-a-skill").mkdir()
+        self.skills_dir = skills_dir
+
+    def skills(self):
+        return list_agent_skills.list_skills_for_agent("claude-code", "project", self.cwd)
+
+    def expected_rows(self):
+        # Keys and key order as emitted before rows became Skill tuples
+        return [
+            {
+                "name": name,
+                "directory": name,
+                "scope": "project",
+                "agent": "claude-code",
+                "agent_display_name": "Claude Code",
+                "path": str(self.skills_dir / name),
+                "description": description,
+            }
+            for name, description in (("alpha", "First skill"), ("beta", "Second skill"))
+        ]
+
+    def test_write_output_json_rows_unchanged(self):
+        out = io.StringIO()
+        count = list_agent_skills.write_output(self.skills(), "json", out=out)
+        self.assertEqual(count, 2)
+        rows = json.loads(out.getvalue())
+        self.assertEqual(rows, self.expected_rows())
+        self.assertEqual([list(r) for r in rows], [list(r) for r in self.expected_rows()])
+
+    def test_format_output_json_matches_json_dumps(self):
+        text = list_agent_skills.format_output(self.skills(), "json", single_agent=True)
+        self.assertEqual(text, json.dumps(self.expected_rows(), indent=2))
+
+    def test_format_output_empty(self):
+        self.assertEqual(list_agent_skills.format_output([], "text"), "No skills found.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for claude-subagents-manager/scripts/list_subagents.py."""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "plugins/claude-code-reflection-skills/skills/claude-subagents-manager/scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import list_subagents  # noqa: E402
+from list_subagents import HEAD_CHUNK, HEAD_LIMIT, parse_frontmatter, read_head  # noqa: E402
+
+
+class ReadHeadTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def write(self, content: str) -> tuple[str, str]:
+        path = self.tmp / "agent.md"
+        path.write_bytes(content.encode("utf-8"))
+        return str(path), content
+
+    def assert_prefix(self, head: str, content: str):
+        self.assertTrue(content.startswith(head))
+
+    def test_multibyte_char_across_block_boundary(self):
+        opening = "---\nname: reviewer\ndescription: "
+        # Pad so each multibyte char starts one byte before the block boundary
+        pad = "a" * (HEAD_CHUNK - 1 - len(opening.encode()))
+        for char in ("€", "é", "😀"):
+            with self.subTest(char=char):
+                path, content = self.write(opening + pad + char + " done\nmodel: opus\n---\n\nBody\n")
+                head = read_head(path)
+                self.assert_prefix(head, content)
+                self.assertIn(char + " done", head)
+                self.assertEqual(parse_frontmatter(head), parse_frontmatter(content))
+                self.assertEqual(parse_frontmatter(head)["model"], "opus")
+
+    def test_stops_at_closing_fence(self):
+        path, content = self.write("---\nname: a\n---\n" + "body line\n" * 20000)
+        head = read_head(path)
+        self.assert_prefix(head, content)
+        self.assertLessEqual(len(head.encode()), HEAD_CHUNK)
+        self.assertEqual(parse_frontmatter(head), {"name": "a"})
+
+    def test_no_frontmatter_reads_one_block(self):
+        path, content = self.write("# Title\n" + "text\n" * 20000)
+        head = read_head(path)
+        self.assert_prefix(head, content)
+        self.assertEqual(len(head.encode()), HEAD_CHUNK)
+        self.assertEqual(parse_frontmatter(head), {})
+
+    def test_no_closing_fence(self):
+        path, content = self.write("---\nname: a\ndescription: never closed\n" + "é" * 1000)
+        head = read_head(path)
+        self.assertEqual(head, content)
+        self.assertEqual(parse_frontmatter(head), {})
+
+    def test_larger_than_cap(self):
+        # Two-byte chars put a character across the HEAD_LIMIT cut
+        path, content = self.write("---\nname: a\ndescription: " + "é" * HEAD_LIMIT + "\n---\n")
+        head = read_head(path)
+        self.assert_prefix(head, content)
+        self.assertLessEqual(len(head.encode()), HEAD_LIMIT)
+        self.assertGreater(len(head.encode()), HEAD_LIMIT - 4)
+        self.assertEqual(parse_frontmatter(head), {})
+
+    def test_invalid_utf8_raises(self):
+        path = self.tmp / "bad.md"
+        path.write_bytes(b"---\nname: \xff\n---\n")
+        with self.assertRaises(UnicodeDecodeError):
+            read_head(str(path))
+
+
+class ReadFrontmatterTest(unittest.TestCase):
+    def test_matches_full_parse(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp)
+        content = "---\nname: a\ndescription: x: y\ntools: Read, Grep\n---\n\n" + "prompt\n" * 5000
+        (tmp / "a.md").write_text(content)
+        agents = []
+        list_subagents.list_agents_dir("project", tmp, agents)
+        self.assertEqual(agents, [{
+            "name": "a",
+            "description": "x: y",
+            "tools": "Read, Grep",
+            "model": "sonnet",
+            "scope": "project",
+            "path": str(tmp / "a.md"),
+        }])
+
+
+if __name__ == "__main__":
+    unittest.main()
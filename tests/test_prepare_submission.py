@@ -0,0 +1,38 @@
+"""Tests for claude-plugins-manager/scripts/prepare_submission.py."""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "plugins/claude-code-reflection-skills/skills/claude-plugins-manager/scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import prepare_submission  # noqa: E402
+
+
+class RunCommandTest(unittest.TestCase):
+    def setUp(self):
+        prepare_submission._missing_commands.clear()
+        self.addCleanup(prepare_submission._missing_commands.clear)
+
+    def test_missing_command_is_remembered(self):
+        ok, _ = prepare_submission.run_command(["no-such-command-xyz"])
+        self.assertFalse(ok)
+        self.assertEqual(prepare_submission._missing_commands, {"no-such-command-xyz"})
+
+    @unittest.skipUnless(shutil.which("git"), "needs git")
+    def test_missing_cwd_does_not_mark_command_missing(self):
+        missing = Path(tempfile.mkdtemp()) / "gone"
+        missing.parent.rmdir()
+        ok, _ = prepare_submission.run_command(["git", "--version"], cwd=str(missing))
+        self.assertFalse(ok)
+        self.assertEqual(prepare_submission._missing_commands, set())
+        ok, output = prepare_submission.run_command(["git", "--version"])
+        self.assertTrue(ok)
+        self.assertTrue(output.startswith("git version"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Tests for skills-manager/scripts/review_skill.py."""
+
+import sys
+import unittest
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "plugins/claude-code-reflection-skills/skills/skills-manager/scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import review_skill  # noqa: E402
+
+
+def messages(issues: list[dict], rule: str) -> list[str]:
+    return [i["message"] for i in issues if i["rule"] == rule]
+
+
+class DescriptionLabelTest(unittest.TestCase):
+    def test_person_label_follows_pattern_priority(self):
+        # "you can" comes first in the text, but "I will" is listed first
+        issues = []
+        review_skill.check_description("You can ask and I will answer. Use when asked.", issues)
+        self.assertEqual(messages(issues, "third-person"),
+                         ["Description uses 'I will' instead of third person"])
+
+    def test_person_label_single_hit(self):
+        issues = []
+        review_skill.check_description("We can process PDFs. Use when the user asks.", issues)
+        self.assertEqual(messages(issues, "third-person"),
+                         ["Description uses 'we can' instead of third person"])
+
+    def test_vague_message(self):
+        issues = []
+        review_skill.check_description("Does stuff", issues)
+        self.assertEqual(messages(issues, "vague-description"), ["Description is too vague: Too vague"])
+
+
+class TimeLabelTest(unittest.TestCase):
+    def check(self, body: str) -> list[str]:
+        issues = []
+        review_skill.check_body(body, Path("/nonexistent"), issues)
+        return messages(issues, "time-sensitive")
+
+    def test_time_label_follows_pattern_priority(self):
+        # "until" and "as of" come first in the text; "after 2019" outranks them
+        self.assertEqual(self.check("Valid until 2030, as of 2024.\nNew API after 2019."),
+                         ["Body contains time-sensitive information (year reference)"])
+
+    def test_date_reference_outranks_year(self):
+        self.assertEqual(self.check("Before 2020 it differed; after March 2021 too."),
+                         ["Body contains time-sensitive information (date reference)"])
+
+    def test_no_time_reference(self):
+        self.assertEqual(self.check("Runs the linter on every file."), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
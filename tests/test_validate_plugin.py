@@ -0,0 +1,80 @@
+"""Tests for claude-plugins-manager/scripts/validate_plugin.py."""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "plugins/claude-code-reflection-skills/skills/claude-plugins-manager/scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import validate_plugin  # noqa: E402
+
+CHUNK = 65536
+
+
+def text_scan(content: str) -> tuple[bool, bool, bool]:
+    """The checks as done before scan_md, on the whole decoded file."""
+    has_frontmatter = content.startswith("---")
+    has_description = has_frontmatter and "description:" in content.split("---")[1]
+    return has_frontmatter, has_description, "TODO" in content
+
+
+def place(size: int, markers: dict[int, str]) -> str:
+    """A filler text of the given size with markers written at fixed offsets."""
+    chars = list("x" * size)
+    for offset, marker in markers.items():
+        chars[offset:offset + len(marker)] = marker
+    return "".join(chars)
+
+
+class ScanMdTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.count = 0
+
+    def check(self, content: str):
+        self.count += 1
+        path = self.tmp / f"{self.count}.md"
+        path.write_text(content)
+        with self.subTest(length=len(content)):
+            self.assertEqual(validate_plugin.scan_md(path), text_scan(content))
+            has_frontmatter, has_description, _ = text_scan(content)
+            self.assertEqual(validate_plugin.scan_md(path, find_todo=False),
+                             (has_frontmatter, has_description, False))
+
+    def test_todo_across_chunk_boundaries(self):
+        for boundary in (CHUNK, 2 * CHUNK):
+            for shift in range(-4, 2):
+                self.check(place(boundary + CHUNK, {0: "---\nname: a\n---\n", boundary + shift: "TODO"}))
+
+    def test_closing_fence_across_chunk_boundaries(self):
+        for boundary in (CHUNK, 2 * CHUNK):
+            for shift in range(-3, 2):
+                self.check(place(boundary + 100, {
+                    0: "---\n", 10: "description: d\n", boundary + shift: "---",
+                }))
+
+    def test_description_across_chunk_boundary(self):
+        for shift in range(-12, 2):
+            self.check(place(CHUNK + 100, {0: "---\n", CHUNK + shift: "description:", CHUNK + 50: "---"}))
+
+    def test_description_after_frontmatter_is_not_counted(self):
+        self.check(place(CHUNK + 100, {0: "---\nname: a\n---\n", CHUNK - 5: "description: d"}))
+
+    def test_unclosed_frontmatter(self):
+        self.check(place(3 * CHUNK, {0: "---\n", 2 * CHUNK + 7: "description: d"}))
+        self.check(place(3 * CHUNK, {0: "---\n"}))
+
+    def test_no_frontmatter(self):
+        self.check(place(2 * CHUNK, {5: "---\ndescription: d\n---", CHUNK - 2: "TODO"}))
+
+    def test_small_files(self):
+        for content in ("", "---", "---\n---", "---\ndescription: d\n---\nTODO\n", "TOD", "plain text\n"):
+            self.check(content)
+
+
+if __name__ == "__main__":
+    unittest.main()